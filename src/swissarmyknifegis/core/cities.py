@@ -5,7 +5,10 @@ Provides coordinates for major cities worldwide to facilitate
 quick centroid selection in GIS tools.
 """
 
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional, Any
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import QComboBox
 
 
@@ -91,6 +94,24 @@ def get_cities_grouped() -> List[Tuple[str, List[Tuple[str, float, float]]]]:
     ]
 
 
+@lru_cache(maxsize=1)
+def _combo_entries() -> Tuple[Tuple[str, Optional[Tuple[float, float]]], ...]:
+    """
+    Build the ordered (label, coords) rows for the city dropdown once.
+    
+    Returns:
+        Tuple of (label, coords) pairs: US cities, then international cities,
+        each preceded by a header row whose coords are None.
+    """
+    (_, us_cities), (_, intl_cities) = get_cities_grouped()
+    return (
+        ("=== UNITED STATES ===", None),
+        *((city, (lon, lat)) for city, lon, lat in us_cities),
+        ("=== INTERNATIONAL ===", None),
+        *((city, (lon, lat)) for city, lon, lat in intl_cities),
+    )
+
+
 def populate_city_combo(combo_widget: QComboBox, placeholder_text: str = "-- Select City --") -> None:
     """
     Populate a QComboBox with major cities organized by region.
@@ -102,19 +123,11 @@ def populate_city_combo(combo_widget: QComboBox, placeholder_text: str = "-- Sel
         combo_widget: QComboBox instance to populate
         placeholder_text: Text for the first (placeholder) item
     """
-    cities = get_major_cities()
-    
-    # Add placeholder item
-    combo_widget.addItem(placeholder_text, None)
-    
-    # Add US cities with separator
-    combo_widget.addItem("=== UNITED STATES ===", None)
-    for city_name, coords in cities.items():
-        if ", USA" in city_name:
-            combo_widget.addItem(city_name, coords)
+    model = QStandardItemModel(combo_widget)
+    for label, coords in [(placeholder_text, None), *_combo_entries()]:
+        item = QStandardItem(label)
+        item.setData(coords, Qt.ItemDataRole.UserRole)
+        model.appendRow(item)
     
-    # Add international cities with separator
-    combo_widget.addItem("=== INTERNATIONAL ===", None)
-    for city_name, coords in cities.items():
-        if ", USA" not in city_name:
-            combo_widget.addItem(city_name, coords)
+    # Install the fully built model in one step instead of one addItem per row
+    combo_widget.setModel(model)
@@ -9,12 +9,11 @@ This module provides functions for:
 
 from functools import lru_cache
 from typing import Tuple, Optional
-from pyproj import Transformer
+from pyproj import CRS, Transformer
 from pyproj.exceptions import CRSError as PyprojCRSError
 from .exceptions import CoordinateError
 
 
-@lru_cache(maxsize=64)
 def calculate_utm_zone(longitude: float) -> int:
     """Calculate UTM zone number from longitude.
     
@@ -24,10 +23,11 @@ def calculate_utm_zone(longitude: float) -> int:
     Returns:
         UTM zone number (1-60)
     """
-    return int((longitude + 180) / 6) + 1
+    # Plain integer math; float inputs rarely repeat, so memoizing this would
+    # only add hashing and cache churn to every call
+    return int((longitude + 180) // 6) + 1
 
 
-@lru_cache(maxsize=64)
 def calculate_utm_epsg(longitude: float, latitude: float) -> int:
     """Calculate UTM EPSG code from longitude and latitude.
     
@@ -46,6 +46,58 @@ def calculate_utm_epsg(longitude: float, latitude: float) -> int:
         return 32700 + utm_zone  # Southern hemisphere
 
 
+@lru_cache(maxsize=256)
+def utm_zone_to_epsg(zone: int, northern: bool) -> str:
+    """Return the EPSG code string for a UTM zone and hemisphere.
+    
+    Args:
+        zone: UTM zone number (1-60)
+        northern: True for the Northern hemisphere, False for the Southern
+        
+    Returns:
+        EPSG code string, e.g. "EPSG:32632" or "EPSG:32732"
+    """
+    return f"EPSG:{(32600 if northern else 32700) + zone}"
+
+
+@lru_cache(maxsize=64)
+def get_transformer(
+    source_crs: str,
+    target_crs: str,
+    always_xy: bool = True
+) -> Transformer:
+    """Return a cached Transformer for a pair of CRS definitions.
+
+    Building a PROJ pipeline is far more expensive than running it, so
+    transformers are memoized per (source, target) pair.
+
+    Args:
+        source_crs: Source CRS (EPSG string or WKT)
+        target_crs: Target CRS (EPSG string or WKT)
+        always_xy: Use traditional GIS order (lon, lat) instead of (lat, lon)
+
+    Returns:
+        pyproj Transformer for the CRS pair
+    """
+    return Transformer.from_crs(source_crs, target_crs, always_xy=always_xy)
+
+
+@lru_cache(maxsize=64)
+def get_crs(crs_code: str) -> CRS:
+    """Return a cached pyproj CRS for a CRS definition.
+    
+    Passing the resulting object to geopandas skips its per-call
+    ``CRS.from_user_input`` lookup in the PROJ database.
+    
+    Args:
+        crs_code: CRS definition (e.g., "EPSG:32633")
+        
+    Returns:
+        pyproj CRS for the definition
+    """
+    return CRS.from_user_input(crs_code)
+
+
 def validate_utm_epsg(epsg_code: int) -> Tuple[bool, Optional[str]]:
     """Validate if EPSG code is a valid UTM zone.
     
@@ -88,11 +140,7 @@ def transform_coordinates(
         CoordinateError: If transformation fails or CRS is invalid
     """
     try:
-        transformer = Transformer.from_crs(
-            source_crs,
-            target_crs,
-            always_xy=always_xy
-        )
+        transformer = get_transformer(source_crs, target_crs, always_xy)
         transformed_x, transformed_y = transformer.transform(x, y)
         return transformed_x, transformed_y
     except PyprojCRSError as e:
@@ -8,18 +8,36 @@ This module provides functions to export GeoDataFrames to various formats:
 - GeoPackage (.gpkg)
 - GML (.gml)
 - MapInfo TAB (.tab)
+- FlatGeobuf (.fgb)
+- GeoParquet (.parquet)
 """
 
+import json
 import logging
+import uuid
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional, Union
 import geopandas as gpd
+from osgeo import gdal
 
 from .exceptions import ExportError
 
 logger = logging.getLogger(__name__)
 
+# pyogrio writes features in bulk through GDAL; fall back to Fiona only when
+# it is not installed
+try:
+    import pyogrio  # noqa: F401
+    _IO_ENGINE = "pyogrio"
+except ImportError:
+    _IO_ENGINE = "fiona"
+
+# A spatial index on a single-feature GeoPackage costs an R-tree build and
+# its triggers for no query benefit
+_GPKG_SINGLE_FEATURE_OPTIONS = {"SPATIAL_INDEX": "NO"}
+
 
 def sanitize_layer_name(name: str) -> str:
     """Sanitize a name for use as a layer name in GIS formats.
@@ -35,6 +53,21 @@ def sanitize_layer_name(name: str) -> str:
     return name.replace(" ", "_").replace(",", "").replace("(", "").replace(")", "")
 
 
+def to_wgs84(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """Return the GeoDataFrame in WGS84, reprojecting only when needed.
+    
+    Args:
+        gdf: GeoDataFrame to convert
+        
+    Returns:
+        The input GeoDataFrame if it is already in EPSG:4326, otherwise a
+        reprojected copy
+    """
+    if gdf.crs is not None and gdf.crs.to_epsg() == 4326:
+        return gdf
+    return gdf.to_crs("EPSG:4326")
+
+
 def export_to_shapefile(
     gdf: gpd.GeoDataFrame,
     output_path: Path,
@@ -54,8 +87,8 @@ def export_to_shapefile(
         ExportError: If export fails
     """
     try:
-        gdf_export = gdf.to_crs("EPSG:4326") if convert_to_wgs84 else gdf
-        gdf_export.to_file(output_path, driver="ESRI Shapefile")
+        gdf_export = to_wgs84(gdf) if convert_to_wgs84 else gdf
+        gdf_export.to_file(output_path, driver="ESRI Shapefile", engine=_IO_ENGINE)
         return str(output_path)
     except Exception as e:
         logger.error(f"Failed to export Shapefile to {output_path}: {str(e)}")
@@ -81,8 +114,8 @@ def export_to_geojson(
         ExportError: If export fails
     """
     try:
-        gdf_export = gdf.to_crs("EPSG:4326") if convert_to_wgs84 else gdf
-        gdf_export.to_file(output_path, driver="GeoJSON")
+        gdf_export = to_wgs84(gdf) if convert_to_wgs84 else gdf
+        gdf_export.to_file(output_path, driver="GeoJSON", engine=_IO_ENGINE)
         return str(output_path)
     except Exception as e:
         logger.error(f"Failed to export GeoJSON to {output_path}: {str(e)}")
@@ -108,8 +141,8 @@ def export_to_kml(
         ExportError: If export fails
     """
     try:
-        gdf_wgs84 = gdf.to_crs("EPSG:4326")
-        gdf_wgs84.to_file(output_path, driver="KML")
+        gdf_wgs84 = to_wgs84(gdf)
+        gdf_wgs84.to_file(output_path, driver="KML", engine=_IO_ENGINE)
         return str(output_path)
     except Exception as e:
         logger.error(f"Failed to export KML to {output_path}: {str(e)}")
@@ -122,7 +155,9 @@ def export_to_kmz(
 ) -> str:
     """Export GeoDataFrame to KMZ format (compressed KML).
     
-    KMZ is a zipped KML file. WGS84 conversion is automatic.
+    KMZ is a zipped KML file. WGS84 conversion is automatic. The KML is
+    rendered into GDAL's in-memory filesystem and streamed straight into
+    the archive, so no temporary file touches the disk.
     
     Args:
         gdf: GeoDataFrame to export
@@ -134,24 +169,14 @@ def export_to_kmz(
     Raises:
         ExportError: If export fails
     """
-    temp_kml = output_path.with_suffix('.kml.temp')
     try:
-        # Create temporary KML file
-        gdf_wgs84 = gdf.to_crs("EPSG:4326")
-        gdf_wgs84.to_file(temp_kml, driver="KML")
-        
-        # Compress to KMZ
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as kmz:
-            kmz.write(temp_kml, 'doc.kml')
-        
-        # Remove temporary KML
-        temp_kml.unlink()
-        
+        # Render through osgeo.gdal itself: pyogrio/fiona wheels bundle their
+        # own libgdal, whose /vsimem this module's gdal cannot see
+        gdf_wgs84 = to_wgs84(gdf)
+        src_ds = _open_ogr_source(gdf_wgs84.to_json())
+        _write_kmz(src_ds, gdf_wgs84.crs.to_wkt(), output_path)
         return str(output_path)
     except Exception as e:
-        # Clean up temp file if it exists
-        if temp_kml.exists():
-            temp_kml.unlink()
         logger.error(f"Failed to export KMZ to {output_path}: {str(e)}")
         raise ExportError(f"Failed to export KMZ to {output_path}: {str(e)}") from e
 
@@ -177,9 +202,11 @@ def export_to_geopackage(
         ExportError: If export fails
     """
     try:
-        gdf_export = gdf.to_crs("EPSG:4326") if convert_to_wgs84 else gdf
+        gdf_export = to_wgs84(gdf) if convert_to_wgs84 else gdf
         sanitized_name = sanitize_layer_name(layer_name)
-        gdf_export.to_file(output_path, driver="GPKG", layer=sanitized_name)
+        layer_options = _GPKG_SINGLE_FEATURE_OPTIONS if len(gdf_export) == 1 else {}
+        gdf_export.to_file(output_path, driver="GPKG", layer=sanitized_name,
+                           engine=_IO_ENGINE, **layer_options)
         return str(output_path)
     except Exception as e:
         logger.error(f"Failed to export GeoPackage to {output_path}: {str(e)}")
@@ -205,8 +232,8 @@ def export_to_gml(
         ExportError: If export fails
     """
     try:
-        gdf_export = gdf.to_crs("EPSG:4326") if convert_to_wgs84 else gdf
-        gdf_export.to_file(output_path, driver="GML")
+        gdf_export = to_wgs84(gdf) if convert_to_wgs84 else gdf
+        gdf_export.to_file(output_path, driver="GML", engine=_IO_ENGINE)
         return str(output_path)
     except Exception as e:
         logger.error(f"Failed to export GML to {output_path}: {str(e)}")
@@ -232,34 +259,230 @@ def export_to_mapinfo(
         ExportError: If export fails
     """
     try:
-        gdf_export = gdf.to_crs("EPSG:4326") if convert_to_wgs84 else gdf
-        gdf_export.to_file(output_path, driver="MapInfo File")
+        gdf_export = to_wgs84(gdf) if convert_to_wgs84 else gdf
+        gdf_export.to_file(output_path, driver="MapInfo File", engine=_IO_ENGINE)
         return str(output_path)
     except Exception as e:
         logger.error(f"Failed to export MapInfo TAB to {output_path}: {str(e)}")
         raise ExportError(f"Failed to export MapInfo TAB to {output_path}: {str(e)}") from e
 
 
+# (format keys, file suffix, OGR driver) in export order
+_MULTI_EXPORT_FORMATS = (
+    (('shp', 'shapefile'), '.shp', "ESRI Shapefile"),
+    (('geojson',), '.geojson', "GeoJSON"),
+    (('kml',), '.kml', "KML"),
+    (('kmz',), '.kmz', "KML"),
+    (('gpkg', 'geopackage'), '.gpkg', "GPKG"),
+    (('gml',), '.gml', "GML"),
+    (('tab', 'mapinfo'), '.tab', "MapInfo File"),
+    (('fgb', 'flatgeobuf'), '.fgb', "FlatGeobuf"),
+)
+
+
+# Format keys for GeoParquet, which is written by pyarrow rather than OGR
+_GEOPARQUET_KEYS = ('parquet', 'geoparquet')
+
+
+# Upper bound on concurrent writers in export_geodataframe_multi
+_MAX_EXPORT_WORKERS = 4
+
+
+def _open_ogr_source(geojson_text: str) -> gdal.Dataset:
+    """Open serialized GeoJSON text as a read-only OGR vector dataset.
+    
+    GDAL opens the text directly without touching the filesystem. GDAL
+    dataset handles are not thread-safe, so each writer opens its own.
+    """
+    ds = gdal.OpenEx(geojson_text, gdal.OF_VECTOR)
+    if ds is None:
+        raise ExportError("Failed to stage GeoDataFrame as an OGR dataset")
+    return ds
+
+
+def _translate(
+    src_ds: gdal.Dataset,
+    dest: str,
+    driver: str,
+    crs_wkt: str,
+    layer_name: str,
+    overwrite: bool = False,
+    layer_options: Optional[Dict[str, str]] = None
+) -> None:
+    """Write ``src_ds`` to ``dest`` with the given driver, tagging ``crs_wkt``."""
+    out_ds = gdal.VectorTranslate(
+        dest, src_ds,
+        format=driver,
+        dstSRS=crs_wkt,
+        reproject=False,
+        layerName=layer_name,
+        accessMode="overwrite" if overwrite else None,
+        layerCreationOptions=[f"{key}={value}" for key, value in (layer_options or {}).items()],
+    )
+    if out_ds is None:
+        raise ExportError(f"GDAL could not write {dest}")
+    # Dropping the reference flushes and closes the dataset
+    out_ds = None
+
+
+def _read_vsimem(path: str) -> bytes:
+    """Read the full contents of a GDAL /vsimem file."""
+    stat = gdal.VSIStatL(path)
+    handle = gdal.VSIFOpenL(path, "rb")
+    try:
+        return gdal.VSIFReadL(1, stat.size, handle)
+    finally:
+        gdal.VSIFCloseL(handle)
+
+
+def _write_kmz(src_ds: gdal.Dataset, crs_wkt: str, out_path: Path) -> None:
+    """Render ``src_ds`` as KML in /vsimem and zip it into ``out_path``."""
+    mem_kml = f"/vsimem/kmz_{uuid.uuid4().hex}/doc.kml"
+    try:
+        _translate(src_ds, mem_kml, "KML", crs_wkt, out_path.stem)
+        with zipfile.ZipFile(out_path, 'w', zipfile.ZIP_DEFLATED) as kmz:
+            kmz.writestr('doc.kml', _read_vsimem(mem_kml))
+    finally:
+        # Only unlink what was created, so a failed translate keeps its own error
+        if gdal.VSIStatL(mem_kml) is not None:
+            gdal.Unlink(mem_kml)
+
+
+def export_to_flatgeobuf(
+    gdf: gpd.GeoDataFrame,
+    output_path: Path,
+    convert_to_wgs84: bool = False
+) -> str:
+    """Export GeoDataFrame to FlatGeobuf format.
+    
+    Args:
+        gdf: GeoDataFrame to export
+        output_path: Output file path (with .fgb extension)
+        convert_to_wgs84: If True, convert to WGS84 before export
+        
+    Returns:
+        Path to exported file
+        
+    Raises:
+        ExportError: If export fails
+    """
+    try:
+        gdf_export = to_wgs84(gdf) if convert_to_wgs84 else gdf
+        gdf_export.to_file(output_path, driver="FlatGeobuf", engine=_IO_ENGINE)
+        return str(output_path)
+    except Exception as e:
+        logger.error(f"Failed to export FlatGeobuf to {output_path}: {str(e)}")
+        raise ExportError(f"Failed to export FlatGeobuf to {output_path}: {str(e)}") from e
+
+
+def _write_geojson(geojson_text: str, epsg: Optional[int], out_path: Path) -> None:
+    """Write serialized GeoJSON straight to disk without an OGR round-trip.
+    
+    Mirrors the GDAL GeoJSON driver's output: the collection is named after
+    the file and carries a ``crs`` member unless it is already WGS84.
+    """
+    document = {"type": "FeatureCollection", "name": out_path.stem}
+    if epsg is not None and epsg != 4326:
+        document["crs"] = {
+            "type": "name",
+            "properties": {"name": f"urn:ogc:def:crs:EPSG::{epsg}"},
+        }
+    document["features"] = json.loads(geojson_text)["features"]
+    out_path.write_text(json.dumps(document), encoding="utf-8")
+
+
+def export_to_geoparquet(
+    gdf: gpd.GeoDataFrame,
+    output_path: Path,
+    convert_to_wgs84: bool = False
+) -> str:
+    """Export GeoDataFrame to GeoParquet format.
+    
+    Written through pyarrow's columnar writer with zstd compression.
+    
+    Args:
+        gdf: GeoDataFrame to export
+        output_path: Output file path (with .parquet extension)
+        convert_to_wgs84: If True, convert to WGS84 before export
+        
+    Returns:
+        Path to exported file
+        
+    Raises:
+        ExportError: If export fails
+    """
+    try:
+        gdf_export = to_wgs84(gdf) if convert_to_wgs84 else gdf
+        gdf_export.to_parquet(output_path, compression="zstd")
+        return str(output_path)
+    except Exception as e:
+        logger.error(f"Failed to export GeoParquet to {output_path}: {str(e)}")
+        raise ExportError(f"Failed to export GeoParquet to {output_path}: {str(e)}") from e
+
+
+def _export_format(
+    geojson_text: str,
+    crs_wkt: str,
+    suffix: str,
+    driver: str,
+    out_path: Path,
+    layer_name: str,
+    single_feature: bool = False,
+    epsg: Optional[int] = None
+) -> str:
+    """Write one output format from serialized GeoJSON; used as a pool task."""
+    try:
+        if driver == "GeoJSON":
+            # The source is already GeoJSON text; only the envelope differs
+            _write_geojson(geojson_text, epsg, out_path)
+            return str(out_path)
+        
+        src_ds = _open_ogr_source(geojson_text)
+        if suffix == '.kmz':
+            _write_kmz(src_ds, crs_wkt, out_path)
+        elif driver == "GPKG":
+            _translate(src_ds, str(out_path), driver, crs_wkt,
+                       sanitize_layer_name(layer_name), overwrite=True,
+                       layer_options=_GPKG_SINGLE_FEATURE_OPTIONS if single_feature else None)
+        else:
+            if out_path.exists():
+                gdal.GetDriverByName(driver).Delete(str(out_path))
+            _translate(src_ds, str(out_path), driver, crs_wkt, out_path.stem)
+        return str(out_path)
+    except Exception as e:
+        logger.error(f"Failed to export {driver} to {out_path}: {str(e)}")
+        raise ExportError(f"Failed to export {driver} to {out_path}: {str(e)}") from e
+
+
 def export_geodataframe_multi(
     gdf: gpd.GeoDataFrame,
     output_prefix: Path,
-    formats: Dict[str, bool],
+    formats: Union[Dict[str, bool], Iterable[str]],
     layer_name: Optional[str] = None,
-    keep_utm: bool = True
+    keep_utm: bool = True,
+    gdf_wgs84: Optional[gpd.GeoDataFrame] = None
 ) -> List[str]:
     """Export GeoDataFrame to multiple formats based on format selection.
     
     This is the main convenience function for batch export operations.
+    The frame is serialized to GeoJSON text once, and the requested formats
+    are written concurrently with ``gdal.VectorTranslate``, each worker
+    reading from its own in-memory OGR handle on that text. GeoJSON output
+    is written from the text directly.
     
     Args:
         gdf: GeoDataFrame to export
         output_prefix: Path prefix for output files (without extension)
         formats: Dict mapping format name to enabled status, e.g.:
             {'shp': True, 'geojson': True, 'kml': False, 'kmz': True,
-             'gpkg': True, 'gml': False, 'tab': False}
+             'gpkg': True, 'gml': False, 'tab': False, 'fgb': False,
+             'parquet': False}
+            or an iterable of the enabled format names, e.g. ('shp', 'kmz')
         layer_name: Layer name for GeoPackage (will be sanitized)
         keep_utm: If True, keep original CRS for formats that support it;
                   if False, convert to WGS84 for all formats except KML/KMZ
+        gdf_wgs84: Optional precomputed WGS84 copy of ``gdf``; when omitted
+                   it is reprojected at most once and shared by all writers
         
     Returns:
         List of successfully exported file paths
@@ -268,47 +491,53 @@ def export_geodataframe_multi(
         Exception: If any export fails
     """
     exported_files = []
-    convert_to_wgs84 = not keep_utm
+    
+    # Reduce either form of format selection to the set of enabled names once
+    if isinstance(formats, dict):
+        enabled = {name for name, is_enabled in formats.items() if is_enabled}
+    else:
+        enabled = set(formats)
+    
+    # Reproject once and hand the WGS84 copy to every writer that needs it
+    if gdf_wgs84 is None and (not keep_utm or not enabled.isdisjoint(('kml', 'kmz'))):
+        gdf_wgs84 = to_wgs84(gdf)
+    gdf_out = gdf if keep_utm else gdf_wgs84
     
     # Use basename as default layer name if not provided
     if layer_name is None:
         layer_name = output_prefix.stem
     
+    # Serialize each frame once; every writer opens its own OGR handle on it
+    sources = {}
+    
+    def source_for(frame: gpd.GeoDataFrame):
+        if id(frame) not in sources:
+            sources[id(frame)] = (frame.to_json(), frame.crs.to_wkt(), frame.crs.to_epsg())
+        return sources[id(frame)]
+    
+    tasks = []
+    for keys, suffix, driver in _MULTI_EXPORT_FORMATS:
+        if enabled.isdisjoint(keys):
+            continue
+        # KML/KMZ are always WGS84
+        frame = gdf_wgs84 if suffix in ('.kml', '.kmz') else gdf_out
+        geojson_text, crs_wkt, epsg = source_for(frame)
+        tasks.append((_export_format, (geojson_text, crs_wkt, suffix, driver,
+                                       output_prefix.with_suffix(suffix), layer_name,
+                                       len(frame) == 1, epsg)))
+    
+    if not enabled.isdisjoint(_GEOPARQUET_KEYS):
+        tasks.append((export_to_geoparquet, (gdf_out, output_prefix.with_suffix('.parquet'))))
+    
+    if not tasks:
+        return exported_files
+    
     try:
-        # Shapefile
-        if formats.get('shp', False) or formats.get('shapefile', False):
-            shp_path = output_prefix.with_suffix('.shp')
-            exported_files.append(export_to_shapefile(gdf, shp_path, convert_to_wgs84))
-        
-        # GeoJSON
-        if formats.get('geojson', False):
-            geojson_path = output_prefix.with_suffix('.geojson')
-            exported_files.append(export_to_geojson(gdf, geojson_path, convert_to_wgs84))
-        
-        # KML (always WGS84)
-        if formats.get('kml', False):
-            kml_path = output_prefix.with_suffix('.kml')
-            exported_files.append(export_to_kml(gdf, kml_path))
-        
-        # KMZ (always WGS84)
-        if formats.get('kmz', False):
-            kmz_path = output_prefix.with_suffix('.kmz')
-            exported_files.append(export_to_kmz(gdf, kmz_path))
-        
-        # GeoPackage
-        if formats.get('gpkg', False) or formats.get('geopackage', False):
-            gpkg_path = output_prefix.with_suffix('.gpkg')
-            exported_files.append(export_to_geopackage(gdf, gpkg_path, layer_name, convert_to_wgs84))
-        
-        # GML
-        if formats.get('gml', False):
-            gml_path = output_prefix.with_suffix('.gml')
-            exported_files.append(export_to_gml(gdf, gml_path, convert_to_wgs84))
-        
-        # MapInfo TAB
-        if formats.get('tab', False) or formats.get('mapinfo', False):
-            tab_path = output_prefix.with_suffix('.tab')
-            exported_files.append(export_to_mapinfo(gdf, tab_path, convert_to_wgs84))
+        # The writers are independent GDAL calls that release the GIL
+        with ThreadPoolExecutor(max_workers=min(_MAX_EXPORT_WORKERS, len(tasks))) as executor:
+            futures = [executor.submit(writer, *args) for writer, args in tasks]
+            for future in futures:
+                exported_files.append(future.result())
         
         return exported_files
         
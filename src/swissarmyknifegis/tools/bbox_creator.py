@@ -22,9 +22,10 @@ from pyproj import CRS
 from swissarmyknifegis.tools.base_tool import BaseTool
 from swissarmyknifegis.core.cities import get_major_cities, populate_city_combo
 from swissarmyknifegis.core.coord_utils import (
-    calculate_utm_epsg, validate_utm_epsg, wgs84_to_utm, utm_to_wgs84, transform_coordinates
+    calculate_utm_epsg, validate_utm_epsg, wgs84_to_utm, utm_to_wgs84, transform_coordinates,
+    get_transformer
 )
-from swissarmyknifegis.core.geo_export_utils import export_geodataframe_multi
+from swissarmyknifegis.core.geo_export_utils import export_geodataframe_multi, to_wgs84
 
 
 class BoundingBoxCreatorTool(BaseTool):
@@ -414,18 +415,17 @@ class BoundingBoxCreatorTool(BaseTool):
                 miny_utm = utm_y - height_m / 2.0
                 maxy_utm = utm_y + height_m / 2.0
                 
-                # Transform corners to WGS84
-                # Transform all four corners
-                sw_lon, sw_lat = transform_coordinates(minx_utm, miny_utm, f"EPSG:{utm_epsg}", "EPSG:4326")
-                se_lon, se_lat = transform_coordinates(maxx_utm, miny_utm, f"EPSG:{utm_epsg}", "EPSG:4326")
-                nw_lon, nw_lat = transform_coordinates(minx_utm, maxy_utm, f"EPSG:{utm_epsg}", "EPSG:4326")
-                ne_lon, ne_lat = transform_coordinates(maxx_utm, maxy_utm, f"EPSG:{utm_epsg}", "EPSG:4326")
+                # Transform all four corners (SW, SE, NW, NE) to WGS84 in one call
+                lons, lats = get_transformer(f"EPSG:{utm_epsg}", "EPSG:4326").transform(
+                    [minx_utm, maxx_utm, minx_utm, maxx_utm],
+                    [miny_utm, miny_utm, maxy_utm, maxy_utm]
+                )
                 
                 # Get min/max from corners (in case of distortion)
-                west = min(sw_lon, se_lon, nw_lon, ne_lon)
-                east = max(sw_lon, se_lon, nw_lon, ne_lon)
-                south = min(sw_lat, se_lat, nw_lat, ne_lat)
-                north = max(sw_lat, se_lat, nw_lat, ne_lat)
+                west = min(lons)
+                east = max(lons)
+                south = min(lats)
+                north = max(lats)
                 
                 # Update preview fields with degrees
                 self.west_preview.setText(f"{west:.6f}°")
@@ -620,13 +620,9 @@ class BoundingBoxCreatorTool(BaseTool):
             # Determine if we should convert to WGS84 for non-KML formats
             use_wgs84 = not self.keep_utm_checkbox.isChecked()
             
-            # Convert to WGS84 if requested
-            if use_wgs84:
-                gdf_export = gdf.to_crs("EPSG:4326")
-                crs_info = "WGS84"
-            else:
-                gdf_export = gdf
-                crs_info = f"UTM EPSG:{utm_epsg}"
+            # Reproject once; shared by the exporters and the text report
+            gdf_wgs84 = to_wgs84(gdf)
+            crs_info = "WGS84" if use_wgs84 else f"UTM EPSG:{utm_epsg}"
             
             # Export to selected formats
             output_prefix = Path(self.output_path_input.text())
@@ -646,7 +642,8 @@ class BoundingBoxCreatorTool(BaseTool):
             exported_files = export_geodataframe_multi(
                 gdf, output_prefix, export_formats,
                 layer_name=bbox_name,
-                keep_utm=self.keep_utm_checkbox.isChecked()
+                keep_utm=self.keep_utm_checkbox.isChecked(),
+                gdf_wgs84=gdf_wgs84
             )
             
             # Text file export (not handled by geo_export_utils)
@@ -666,8 +663,7 @@ class BoundingBoxCreatorTool(BaseTool):
                     wgs84_lon, wgs84_lat = utm_to_wgs84(input_x, input_y, utm_epsg)
                 
                 # Get WGS84 bbox extents if converted
-                gdf_wgs84_bounds = gdf.to_crs("EPSG:4326")
-                wgs84_bounds = gdf_wgs84_bounds.total_bounds
+                wgs84_bounds = gdf_wgs84.total_bounds
                 
                 # Get dimension values
                 width_val = self.width_input.value()
@@ -745,8 +741,7 @@ class BoundingBoxCreatorTool(BaseTool):
                 txt_content.append("========================================")
                 
                 # Write to file
-                with open(txt_path, 'w', encoding='utf-8') as f:
-                    f.write('\n'.join(txt_content))
+                txt_path.write_text('\n'.join(txt_content), encoding='utf-8')
                 
                 exported_files.append(str(txt_path))
                 
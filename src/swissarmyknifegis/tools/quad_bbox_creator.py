@@ -5,30 +5,35 @@ Creates a bounding box by specifying four arbitrary corner points.
 
 from pathlib import Path
 from typing import Optional, Tuple
-import zipfile
-import json
 import logging
+import re
+import time
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QSignalBlocker, QLocale
 from PySide6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox,
     QLabel, QLineEdit, QPushButton, QRadioButton, 
     QCheckBox, QFileDialog, QMessageBox, QButtonGroup,
-    QTextEdit, QComboBox
+    QComboBox, QMainWindow
 )
-from PySide6.QtGui import QIntValidator
+from PySide6.QtGui import QIntValidator, QDoubleValidator
 
 import geopandas as gpd
-from shapely.geometry import Polygon, mapping
-from pyproj import CRS
+import numpy as np
+import shapely
+from shapely.geometry import Polygon
 from osgeo import gdal
 
 from swissarmyknifegis.tools.base_tool import BaseTool
-from swissarmyknifegis.core.cities import get_major_cities, populate_city_combo
+from swissarmyknifegis.core.cities import populate_city_combo
 from swissarmyknifegis.core.coord_utils import (
-    calculate_utm_epsg, validate_utm_epsg, wgs84_to_utm, utm_to_wgs84, transform_coordinates
+    calculate_utm_epsg, calculate_utm_zone, utm_zone_to_epsg, validate_utm_epsg, get_transformer,
+    get_crs
 )
-from swissarmyknifegis.core.geo_export_utils import export_geodataframe_multi
+from swissarmyknifegis.core.geo_export_utils import export_geodataframe_multi, to_wgs84
+
+# Configure GDAL to use Python exceptions
+gdal.UseExceptions()
 
 
 class QuadBBoxCreatorTool(BaseTool):
@@ -37,15 +42,30 @@ class QuadBBoxCreatorTool(BaseTool):
     # Default offset for city-based bounding boxes (approximately 0.1 degrees = ~11 km)
     DEFAULT_CITY_BBOX_OFFSET_DEGREES = 0.1
     
+    # Preview coalescing window: the first edit after an idle period renders
+    # immediately, later edits inside the window collapse into one trailing update.
+    # 400 ms covers a typing burst without making the trailing update feel laggy.
+    PREVIEW_COALESCE_MS = 400
+    
+    # Plain decimal/scientific numbers; rejects partial input such as "-" or "" without raising
+    _NUMBER_RE = re.compile(r'^[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?$')
+    
     def __init__(self, parent=None):
-        self.cities = get_major_cities()
+        # Memoized UTM geometry for the current inputs, keyed by the raw field text
+        self._geometry_key = None
+        self._geometry_cache = {}
+        # Inputs the preview fields currently reflect
+        self._last_preview_key = None
+        # Shared modal message box, created on first use and reused afterwards
+        self._message_box = None
         
         # Debounce timer for preview updates (prevents excessive computation)
         # Must be created BEFORE super().__init__() since setup_ui() triggers preview
+        self._last_preview_time = 0.0
         self._preview_debounce_timer = QTimer()
         self._preview_debounce_timer.setSingleShot(True)
-        self._preview_debounce_timer.setInterval(300)  # 300ms delay
-        self._preview_debounce_timer.timeout.connect(self._do_update_preview)
+        self._preview_debounce_timer.setInterval(self.PREVIEW_COALESCE_MS)
+        self._preview_debounce_timer.timeout.connect(self._run_preview)
         
         super().__init__(parent)
         
@@ -54,6 +74,9 @@ class QuadBBoxCreatorTool(BaseTool):
     
     def setup_ui(self):
         """Set up the user interface for the 4-point bounding box creator."""
+        # Hold off repaints while the widget tree is built; re-enabled below so
+        # Qt does a single layout/paint pass instead of one per addRow
+        self.setUpdatesEnabled(False)
         main_layout = QVBoxLayout(self)
         main_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         
@@ -137,31 +160,34 @@ class QuadBBoxCreatorTool(BaseTool):
         self.west_input.setPlaceholderText("Minimum longitude / X coordinate")
         bounds_layout.addRow("West:", self.west_input)
         
+        # Reject non-numeric typing up front; the C locale keeps '.' as the decimal
+        # separator so the text always matches what _parse_boundaries expects
+        for boundary_input in self._boundary_inputs():
+            validator = QDoubleValidator(boundary_input)
+            validator.setLocale(QLocale.c())
+            boundary_input.setValidator(validator)
+        
         bounds_group.setLayout(bounds_layout)
         main_layout.addWidget(bounds_group)
         
         # Preview Section
         preview_group = QGroupBox("Preview")
         preview_layout = QFormLayout()
+        # One selector for every read-only preview field instead of a stylesheet per widget
+        preview_group.setStyleSheet('QLineEdit[readOnly="true"] { background-color: #f0f0f0; }')
         
         self.preview_centroid_x = QLineEdit()
         self.preview_centroid_x.setReadOnly(True)
-        self.preview_centroid_x.setStyleSheet("QLineEdit { background-color: #f0f0f0; }")
         self.preview_centroid_y = QLineEdit()
         self.preview_centroid_y.setReadOnly(True)
-        self.preview_centroid_y.setStyleSheet("QLineEdit { background-color: #f0f0f0; }")
         self.preview_width = QLineEdit()
         self.preview_width.setReadOnly(True)
-        self.preview_width.setStyleSheet("QLineEdit { background-color: #f0f0f0; }")
         self.preview_height = QLineEdit()
         self.preview_height.setReadOnly(True)
-        self.preview_height.setStyleSheet("QLineEdit { background-color: #f0f0f0; }")
         self.preview_area = QLineEdit()
         self.preview_area.setReadOnly(True)
-        self.preview_area.setStyleSheet("QLineEdit { background-color: #f0f0f0; }")
         self.preview_perimeter = QLineEdit()
         self.preview_perimeter.setReadOnly(True)
-        self.preview_perimeter.setStyleSheet("QLineEdit { background-color: #f0f0f0; }")
         
         preview_layout.addRow("Centroid X (m):", self.preview_centroid_x)
         preview_layout.addRow("Centroid Y (m):", self.preview_centroid_y)
@@ -218,18 +244,36 @@ class QuadBBoxCreatorTool(BaseTool):
         self.format_gpkg = QCheckBox("GeoPackage")
         self.format_gml = QCheckBox("GML")
         self.format_tab = QCheckBox("MapInfo TAB")
+        self.format_fgb = QCheckBox("FlatGeobuf")
+        self.format_parquet = QCheckBox("GeoParquet")
         
         format_layout2.addWidget(self.format_kmz)
         format_layout2.addWidget(self.format_gpkg)
         format_layout2.addWidget(self.format_gml)
         format_layout2.addWidget(self.format_tab)
+        format_layout2.addWidget(self.format_fgb)
+        format_layout2.addWidget(self.format_parquet)
         output_layout.addLayout(format_layout2)
         
+        self._format_checkboxes = (
+            self.format_kml, self.format_shp, self.format_geojson, self.format_txt,
+            self.format_kmz, self.format_gpkg, self.format_gml, self.format_tab,
+            self.format_fgb, self.format_parquet
+        )
+        # (export_geodataframe_multi format name, checkbox) for the GIS outputs
+        self._export_format_checkboxes = (
+            ('geojson', self.format_geojson), ('shp', self.format_shp),
+            ('gpkg', self.format_gpkg), ('gml', self.format_gml),
+            ('tab', self.format_tab), ('kml', self.format_kml),
+            ('kmz', self.format_kmz), ('fgb', self.format_fgb),
+            ('parquet', self.format_parquet)
+        )
+        
         # Keep UTM projection option
         self.keep_utm = QCheckBox("Keep UTM projection (where possible)")
         self.keep_utm.setChecked(True)
         self.keep_utm.setToolTip(
-            "When checked, exports Shapefile, GeoJSON, GeoPackage, GML, and MapInfo TAB in UTM projection.\n"
+            "When checked, exports Shapefile, GeoJSON, GeoPackage, GML, MapInfo TAB, and FlatGeobuf in UTM projection.\n"
             "KML and KMZ always use WGS84. When unchecked, all formats use WGS84."
         )
         output_layout.addWidget(self.keep_utm)
@@ -251,19 +295,29 @@ class QuadBBoxCreatorTool(BaseTool):
         self.utm_radio.toggled.connect(self._on_coord_system_changed)
         self.location_combo.currentIndexChanged.connect(self._on_location_selected)
         
-        # Connect all boundary inputs to update preview
-        self.north_input.textChanged.connect(self._update_preview)
-        self.south_input.textChanged.connect(self._update_preview)
-        self.east_input.textChanged.connect(self._update_preview)
-        self.west_input.textChanged.connect(self._update_preview)
+        # Connect all boundary inputs to update preview once a value is committed
+        # (Enter or focus-out); programmatic edits call _update_preview themselves
+        self.north_input.editingFinished.connect(self._update_preview)
+        self.south_input.editingFinished.connect(self._update_preview)
+        self.east_input.editingFinished.connect(self._update_preview)
+        self.west_input.editingFinished.connect(self._update_preview)
+        # editingFinished is not emitted while the validator reports Intermediate
+        # (cleared field, lone "-"), so drop the stale preview as soon as that happens
+        for boundary_input in self._boundary_inputs():
+            boundary_input.textChanged.connect(self._clear_preview_if_unacceptable)
+            boundary_input.inputRejected.connect(self._clear_preview_if_unacceptable)
         
         self.utm_epsg_input.textChanged.connect(self._update_preview)
         
+        self.setUpdatesEnabled(True)
+        
     def _on_coord_system_changed(self):
         """Handle coordinate system radio button changes and convert existing coordinates."""
         self.utm_zone_group.setVisible(self.utm_radio.isChecked())
         
-        # Try to convert existing boundary values when switching modes
+        # Try to convert existing boundary values when switching modes; field signals
+        # stay silent while they are rewritten and the preview is refreshed once below
+        blockers = [QSignalBlocker(widget) for widget in self._coordinate_inputs()]
         boundaries = self._parse_boundaries()
         if boundaries:
             north, south, east, west = boundaries
@@ -271,25 +325,7 @@ class QuadBBoxCreatorTool(BaseTool):
             if self.utm_radio.isChecked():
                 # Switching to UTM mode - convert from Lon/Lat
                 try:
-                    # Determine UTM zone from center of bbox
-                    center_lon = (east + west) / 2
-                    center_lat = (north + south) / 2
-                    utm_epsg_code = calculate_utm_epsg(center_lon, center_lat)
-                    
-                    epsg_code = f"EPSG:{utm_epsg_code}"
-                    self.utm_epsg_input.setText(str(utm_epsg_code))
-                    
-                    # Transform corners to UTM
-                    nw_x, nw_y = transform_coordinates(west, north, "EPSG:4326", epsg_code)
-                    ne_x, ne_y = transform_coordinates(east, north, "EPSG:4326", epsg_code)
-                    se_x, se_y = transform_coordinates(east, south, "EPSG:4326", epsg_code)
-                    sw_x, sw_y = transform_coordinates(west, south, "EPSG:4326", epsg_code)
-                    
-                    # Display boundaries in UTM
-                    self.north_input.setText(f"{max(nw_y, ne_y):.2f}")
-                    self.south_input.setText(f"{min(se_y, sw_y):.2f}")
-                    self.east_input.setText(f"{max(ne_x, se_x):.2f}")
-                    self.west_input.setText(f"{min(nw_x, sw_x):.2f}")
+                    self._convert_lonlat_inputs_to_utm(north, south, east, west)
                 except Exception as e:
                     # If conversion fails, skip it but still update preview
                     logging.debug(f"Coordinate conversion failed when switching to UTM mode: {e}")
@@ -302,20 +338,20 @@ class QuadBBoxCreatorTool(BaseTool):
                         epsg_code = f"EPSG:{epsg_text}"
                         
                         # Transform corners from UTM to Lon/Lat
-                        nw_lon, nw_lat = transform_coordinates(west, north, epsg_code, "EPSG:4326")
-                        ne_lon, ne_lat = transform_coordinates(east, north, epsg_code, "EPSG:4326")
-                        se_lon, se_lat = transform_coordinates(east, south, epsg_code, "EPSG:4326")
-                        sw_lon, sw_lat = transform_coordinates(west, south, epsg_code, "EPSG:4326")
+                        new_north, new_south, new_east, new_west = self._corner_extents(
+                            self._transform_corners(north, south, east, west, epsg_code, "EPSG:4326")
+                        )
                         
                         # Display boundaries in Lon/Lat
-                        self.north_input.setText(f"{max(nw_lat, ne_lat):.6f}")
-                        self.south_input.setText(f"{min(se_lat, sw_lat):.6f}")
-                        self.east_input.setText(f"{max(ne_lon, se_lon):.6f}")
-                        self.west_input.setText(f"{min(nw_lon, sw_lon):.6f}")
+                        self.north_input.setText(f"{new_north:.6f}")
+                        self.south_input.setText(f"{new_south:.6f}")
+                        self.east_input.setText(f"{new_east:.6f}")
+                        self.west_input.setText(f"{new_west:.6f}")
                     except Exception as e:
                         # If conversion fails, clear EPSG and don't convert coordinates
                         logging.debug(f"Coordinate conversion failed when switching to Lon/Lat mode: {e}")
                         self.utm_epsg_input.clear()
+        del blockers
         
         # Update UTM rounding combo state based on current mode
         self.utm_rounding_combo.setEnabled(self.utm_radio.isChecked())
@@ -335,19 +371,18 @@ class QuadBBoxCreatorTool(BaseTool):
         if not boundaries:
             return
         
-        north, south, east, west = boundaries
-        
-        # Round to nearest value
-        north = round(north / rounding_value) * rounding_value
-        south = round(south / rounding_value) * rounding_value
-        east = round(east / rounding_value) * rounding_value
-        west = round(west / rounding_value) * rounding_value
+        # Round all four boundaries to the nearest value in one pass
+        north, south, east, west = np.round(np.asarray(boundaries) / rounding_value) * rounding_value
         
-        # Update values
+        # Update values without per-field signals, then refresh the preview once
+        blockers = [QSignalBlocker(widget) for widget in self._coordinate_inputs()]
         self.north_input.setText(f"{north:.2f}")
         self.south_input.setText(f"{south:.2f}")
         self.east_input.setText(f"{east:.2f}")
         self.west_input.setText(f"{west:.2f}")
+        del blockers
+        
+        self._update_preview()
     
     def _on_location_selected(self, index: int):
         """Handle city selection from dropdown."""
@@ -369,6 +404,9 @@ class QuadBBoxCreatorTool(BaseTool):
         east = lon + offset
         west = lon - offset
         
+        # Silence the field signals while filling them; the preview is refreshed once below
+        blockers = [QSignalBlocker(widget) for widget in self._coordinate_inputs()]
+        
         if self.lonlat_radio.isChecked():
             # Direct Lon/Lat input
             self.north_input.setText(f"{north:.6f}")
@@ -376,27 +414,46 @@ class QuadBBoxCreatorTool(BaseTool):
             self.east_input.setText(f"{east:.6f}")
             self.west_input.setText(f"{west:.6f}")
         else:
-            # Convert to UTM first
-            utm_epsg_code = calculate_utm_epsg(lon, lat)
-            epsg_code = f"EPSG:{utm_epsg_code}"
-            
-            self.utm_epsg_input.setText(str(utm_epsg_code))
-            
-            # Transform corners to UTM
-            nw_x, nw_y = transform_coordinates(west, north, "EPSG:4326", epsg_code)
-            ne_x, ne_y = transform_coordinates(east, north, "EPSG:4326", epsg_code)
-            se_x, se_y = transform_coordinates(east, south, "EPSG:4326", epsg_code)
-            sw_x, sw_y = transform_coordinates(west, south, "EPSG:4326", epsg_code)
-            
-            # Display boundaries in UTM
-            self.north_input.setText(f"{max(nw_y, ne_y):.2f}")
-            self.south_input.setText(f"{min(se_y, sw_y):.2f}")
-            self.east_input.setText(f"{max(ne_x, se_x):.2f}")
-            self.west_input.setText(f"{min(nw_x, sw_x):.2f}")
+            self._convert_lonlat_inputs_to_utm(north, south, east, west)
+        
+        del blockers
+        self._update_preview()
+    
+    def _convert_lonlat_inputs_to_utm(self, north: float, south: float, east: float, west: float):
+        """Write the UTM zone and UTM extents of a Lon/Lat box into the inputs.
+        
+        The zone is taken from the box center and the extents from one
+        batched transform of the four corners.
+        """
+        center_lon = (east + west) / 2
+        center_lat = (north + south) / 2
+        utm_epsg_code = calculate_utm_epsg(center_lon, center_lat)
+        epsg_code = f"EPSG:{utm_epsg_code}"
+        
+        self.utm_epsg_input.setText(str(utm_epsg_code))
+        
+        # Transform corners to UTM
+        utm_north, utm_south, utm_east, utm_west = self._corner_extents(
+            self._transform_corners(north, south, east, west, "EPSG:4326", epsg_code)
+        )
+        
+        # Display boundaries in UTM
+        self.north_input.setText(f"{utm_north:.2f}")
+        self.south_input.setText(f"{utm_south:.2f}")
+        self.east_input.setText(f"{utm_east:.2f}")
+        self.west_input.setText(f"{utm_west:.2f}")
+    
+    def _boundary_inputs(self) -> tuple:
+        """Return the north, south, east and west line edits."""
+        return (self.north_input, self.south_input, self.east_input, self.west_input)
+    
+    def _coordinate_inputs(self) -> tuple:
+        """Return the line edits whose edits drive the preview."""
+        return (*self._boundary_inputs(), self.utm_epsg_input)
     
     def _format_bbox_text_report(self, bbox_name: str, north: float, south: float, 
                                   east: float, west: float, utm_epsg: str, 
-                                  polygon, gdf, input_mode: str) -> str:
+                                  polygon, gdf_wgs84, input_mode: str) -> str:
         """Format comprehensive text report for bounding box parameters.
         
         Args:
@@ -404,7 +461,7 @@ class QuadBBoxCreatorTool(BaseTool):
             north, south, east, west: Input boundary values
             utm_epsg: UTM EPSG code (e.g., 'EPSG:32633')
             polygon: Shapely polygon geometry in UTM
-            gdf: GeoDataFrame containing the bbox geometry
+            gdf_wgs84: GeoDataFrame containing the bbox geometry in WGS84
             input_mode: Description of input coordinate system
             
         Returns:
@@ -415,75 +472,66 @@ class QuadBBoxCreatorTool(BaseTool):
         perimeter = polygon.length
         
         # Get WGS84 bounds for display
-        gdf_wgs84 = gdf.to_crs("EPSG:4326")
         wgs84_bounds = gdf_wgs84.total_bounds
         wgs84_poly = gdf_wgs84.geometry.iloc[0]
         
+        keep_utm = self.keep_utm.isChecked()
+        output_crs = ('UTM ' + utm_epsg) if keep_utm else 'WGS84 (EPSG:4326)'
+        
+        # Corner points, skipping the duplicated closing vertex
+        coords_wgs84 = np.asarray(wgs84_poly.exterior.coords)[:-1]
+        corner_lines = "\n".join(
+            f"  Point {i}: ({lon:.6f}, {lat:.6f})" for i, (lon, lat) in enumerate(coords_wgs84, 1)
+        )
+        
         # Build text content in comprehensive format
-        txt_content = []
-        txt_content.append("========================================")
-        txt_content.append("   BOUNDING BOX PARAMETERS")
-        txt_content.append("========================================")
-        txt_content.append("")
-        
-        # Input boundaries section
-        txt_content.append("--- INPUT BOUNDARIES ---")
-        txt_content.append("")
-        txt_content.append(f"North: {north}")
-        txt_content.append(f"South: {south}")
-        txt_content.append(f"East: {east}")
-        txt_content.append(f"West: {west}")
-        txt_content.append("")
-        
-        # Bounding box extents section
-        txt_content.append("--- BOUNDING BOX EXTENTS ---")
-        txt_content.append("")
-        txt_content.append(f"UTM ({utm_epsg}):")
-        txt_content.append(f"  Min X (West):  {minx:.2f} m")
-        txt_content.append(f"  Max X (East):  {maxx:.2f} m")
-        txt_content.append(f"  Min Y (South): {miny:.2f} m")
-        txt_content.append(f"  Max Y (North): {maxy:.2f} m")
-        txt_content.append("")
-        txt_content.append("WGS84 (EPSG:4326):")
-        txt_content.append(f"  Min Lon (West):  {wgs84_bounds[0]:.6f}°")
-        txt_content.append(f"  Max Lon (East):  {wgs84_bounds[2]:.6f}°")
-        txt_content.append(f"  Min Lat (South): {wgs84_bounds[1]:.6f}°")
-        txt_content.append(f"  Max Lat (North): {wgs84_bounds[3]:.6f}°")
-        txt_content.append("")
-        
-        # Size and geometry section
-        txt_content.append("--- SIZE AND GEOMETRY ---")
-        txt_content.append("")
-        txt_content.append(f"Area:       {area:.2f} m² ({area/1e6:.4f} km²)")
-        txt_content.append(f"Perimeter:  {perimeter:.2f} m ({perimeter/1e3:.4f} km)")
-        txt_content.append("")
-        
-        # CRS information section
-        txt_content.append("--- COORDINATE REFERENCE SYSTEM ---")
-        txt_content.append("")
-        txt_content.append(f"Input CRS:  {input_mode}")
-        txt_content.append(f"Output CRS: {('UTM ' + utm_epsg) if self.keep_utm.isChecked() else 'WGS84 (EPSG:4326)'}")
-        txt_content.append(f"UTM Zone:   {utm_epsg}")
-        txt_content.append("")
-        
-        # Configuration section
-        txt_content.append("--- CONFIGURATION ---")
-        txt_content.append("")
-        txt_content.append(f"Bounding Box Name: {bbox_name}")
-        txt_content.append(f"Input Method:      Point boundaries")
-        txt_content.append(f"Keep UTM Projection: {'Yes' if self.keep_utm.isChecked() else 'No'}")
-        txt_content.append("")
-        
-        # Corner points section
-        txt_content.append("--- CORNER POINTS (WGS84) ---")
-        txt_content.append("")
-        coords_wgs84 = list(wgs84_poly.exterior.coords)[:-1]  # Remove duplicate last point
-        for i, (lon, lat) in enumerate(coords_wgs84, 1):
-            txt_content.append(f"  Point {i}: ({lon:.6f}, {lat:.6f})")
-        txt_content.append("")
-        txt_content.append("========================================")
-        
-        return '\n'.join(txt_content)
+        return f"""========================================
+   BOUNDING BOX PARAMETERS
+========================================
+
+--- INPUT BOUNDARIES ---
+
+North: {north}
+South: {south}
+East: {east}
+West: {west}
+
+--- BOUNDING BOX EXTENTS ---
+
+UTM ({utm_epsg}):
+  Min X (West):  {minx:.2f} m
+  Max X (East):  {maxx:.2f} m
+  Min Y (South): {miny:.2f} m
+  Max Y (North): {maxy:.2f} m
+
+WGS84 (EPSG:4326):
+  Min Lon (West):  {wgs84_bounds[0]:.6f}°
+  Max Lon (East):  {wgs84_bounds[2]:.6f}°
+  Min Lat (South): {wgs84_bounds[1]:.6f}°
+  Max Lat (North): {wgs84_bounds[3]:.6f}°
+
+--- SIZE AND GEOMETRY ---
+
+Area:       {area:.2f} m² ({area/1e6:.4f} km²)
+Perimeter:  {perimeter:.2f} m ({perimeter/1e3:.4f} km)
+
+--- COORDINATE REFERENCE SYSTEM ---
+
+Input CRS:  {input_mode}
+Output CRS: {output_crs}
+UTM Zone:   {utm_epsg}
+
+--- CONFIGURATION ---
+
+Bounding Box Name: {bbox_name}
+Input Method:      Point boundaries
+Keep UTM Projection: {'Yes' if keep_utm else 'No'}
+
+--- CORNER POINTS (WGS84) ---
+
+{corner_lines}
+
+========================================"""
     
     def _browse_output(self):
         """Open file dialog to select output path."""
@@ -506,79 +554,194 @@ class QuadBBoxCreatorTool(BaseTool):
         Returns:
             Tuple of (north, south, east, west) or None if invalid
         """
-        try:
-            north_text = self.north_input.text().strip()
-            south_text = self.south_input.text().strip()
-            east_text = self.east_input.text().strip()
-            west_text = self.west_input.text().strip()
-            
-            if not all([north_text, south_text, east_text, west_text]):
-                return None
-            
-            north = float(north_text)
-            south = float(south_text)
-            east = float(east_text)
-            west = float(west_text)
-            
-            return (north, south, east, west)
-        except ValueError:
+        texts = (
+            self.north_input.text().strip(),
+            self.south_input.text().strip(),
+            self.east_input.text().strip(),
+            self.west_input.text().strip(),
+        )
+        
+        # Fast reject while the user is mid-typing, before any float() can raise
+        match = self._NUMBER_RE.match
+        if not all(match(text) for text in texts):
             return None
+        
+        north, south, east, west = (float(text) for text in texts)
+        return (north, south, east, west)
     
-    def _boundaries_to_utm(self, north: float, south: float, east: float, west: float) -> Tuple[list, str]:
+    def _boundaries_to_utm(self, north: float, south: float, east: float, west: float) -> Tuple[np.ndarray, str]:
         """
         Convert boundary coordinates to UTM and return corner points.
-        Returns (utm_corner_coords, epsg_code)
+        Returns (utm_corner_coords, epsg_code); the corners are a (4, 2) array,
+        or empty with an empty epsg_code when no UTM zone is set.
         """
         if self.utm_radio.isChecked():
             # Already in UTM
             epsg_code = self.utm_epsg_input.text().strip()
             if not epsg_code:
-                return [], ""
+                return np.empty((0, 2)), ""
             # Create corners: NW, NE, SE, SW
-            corners = [
-                (west, north),
-                (east, north),
-                (east, south),
-                (west, south)
-            ]
+            corners = np.column_stack((
+                [west, east, east, west],
+                [north, north, south, south]
+            )).astype(np.float64)
             return corners, f"EPSG:{epsg_code}"
         
         # Convert from lon/lat to UTM
         # Use center point to determine UTM zone
         center_lon = (east + west) / 2
         center_lat = (north + south) / 2
-        utm_epsg_num = calculate_utm_epsg(center_lon, center_lat)
-        epsg_code = f"EPSG:{utm_epsg_num}"
+        epsg_code = utm_zone_to_epsg(calculate_utm_zone(center_lon), center_lat >= 0)
         
         # Transform corner coordinates
-        # Create corners: NW, NE, SE, SW (clockwise from top-left)
-        corners = [
-            transform_coordinates(west, north, "EPSG:4326", epsg_code),
-            transform_coordinates(east, north, "EPSG:4326", epsg_code),
-            transform_coordinates(east, south, "EPSG:4326", epsg_code),
-            transform_coordinates(west, south, "EPSG:4326", epsg_code)
-        ]
+        corners = self._transform_corners(north, south, east, west, "EPSG:4326", epsg_code)
         
         return corners, epsg_code
     
+    def _input_key(self) -> tuple:
+        """Return a hashable snapshot of every input that affects the geometry."""
+        return (
+            self.north_input.text(), self.south_input.text(),
+            self.east_input.text(), self.west_input.text(),
+            self.utm_epsg_input.text(), self.utm_radio.isChecked(),
+        )
+    
+    def _utm_geometry(self) -> Optional[Tuple[tuple, np.ndarray, str]]:
+        """Return (boundaries, utm_corners, epsg_code) for the current inputs.
+        
+        The result is memoized while the boundary fields, EPSG code and
+        coordinate mode are unchanged, so the preview, validation and export
+        share a single conversion.
+        
+        Returns:
+            Tuple of (boundaries, utm_corners, epsg_code) or None if the
+            boundaries cannot be parsed
+        """
+        key = self._input_key()
+        if key != self._geometry_key:
+            self._geometry_key = key
+            self._geometry_cache = {}
+        
+        if "utm" not in self._geometry_cache:
+            boundaries = self._parse_boundaries()
+            if boundaries is None:
+                self._geometry_cache["utm"] = None
+            else:
+                utm_corners, epsg_code = self._boundaries_to_utm(*boundaries)
+                self._geometry_cache["utm"] = (boundaries, utm_corners, epsg_code)
+        return self._geometry_cache["utm"]
+    
+    def _utm_polygon(self) -> Optional[Polygon]:
+        """Return the memoized UTM Polygon for the current inputs, or None."""
+        geometry = self._utm_geometry()
+        if not geometry or not geometry[2]:
+            return None
+        if "polygon" not in self._geometry_cache:
+            # Shapely 2 array constructor reads the (4, 2) corner buffer directly
+            # and closes the ring itself
+            self._geometry_cache["polygon"] = shapely.polygons(geometry[1])
+        return self._geometry_cache["polygon"]
+    
+    def _utm_polygon_is_valid(self) -> bool:
+        """Return the memoized validity of the UTM Polygon for the current inputs."""
+        if "is_valid" not in self._geometry_cache:
+            geometry = self._utm_geometry()
+            if geometry and geometry[2] and self.utm_radio.isChecked():
+                # UTM corners form an axis-aligned rectangle, which is valid
+                # exactly when it has positive width and height; no GEOS call
+                north, south, east, west = geometry[0]
+                self._geometry_cache["is_valid"] = north > south and east > west
+            else:
+                polygon = self._utm_polygon()
+                self._geometry_cache["is_valid"] = (
+                    polygon is not None and bool(shapely.is_valid(polygon))
+                )
+        return self._geometry_cache["is_valid"]
+    
+    @staticmethod
+    def _transform_corners(north: float, south: float, east: float, west: float,
+                           source_crs: str, target_crs: str) -> np.ndarray:
+        """Transform the four bbox corners in a single vectorized PROJ call.
+        
+        Returns:
+            (4, 2) array of x, y rows ordered NW, NE, SE, SW (clockwise from top-left)
+        """
+        xs, ys = get_transformer(source_crs, target_crs).transform(
+            np.array([west, east, east, west], dtype=np.float64),
+            np.array([north, north, south, south], dtype=np.float64)
+        )
+        return np.column_stack((xs, ys))
+    
+    @staticmethod
+    def _corner_extents(corners: np.ndarray) -> Tuple[float, float, float, float]:
+        """Return the (north, south, east, west) extents of NW, NE, SE, SW corners.
+        
+        Each edge is the outer of its two corners, picked with a plain
+        conditional rather than a max()/min() builtin call.
+        """
+        (nw_x, nw_y), (ne_x, ne_y), (se_x, se_y), (sw_x, sw_y) = corners.tolist()
+        return (
+            nw_y if nw_y > ne_y else ne_y,
+            se_y if se_y < sw_y else sw_y,
+            ne_x if ne_x > se_x else se_x,
+            nw_x if nw_x < sw_x else sw_x,
+        )
+    
+    @staticmethod
+    def _ring_area_perimeter(corners: np.ndarray) -> Tuple[float, float]:
+        """Compute planar area (shoelace) and perimeter of a closed corner ring.
+        
+        Args:
+            corners: (N, 2) array of x, y rows; the ring is closed implicitly
+            
+        Returns:
+            Tuple of (area, perimeter) in CRS units
+        """
+        xs, ys = corners[:, 0], corners[:, 1]
+        next_xs, next_ys = np.roll(xs, -1), np.roll(ys, -1)
+        area = abs(np.dot(xs, next_ys) - np.dot(next_xs, ys)) / 2
+        perimeter = np.hypot(next_xs - xs, next_ys - ys).sum()
+        return float(area), float(perimeter)
+    
     def _update_preview(self):
-        """Schedule a debounced preview update to avoid excessive computations."""
-        # Restart the timer - this debounces rapid changes (e.g., typing EPSG codes)
-        self._preview_debounce_timer.stop()
-        self._preview_debounce_timer.start()
+        """Update the preview now if idle, otherwise coalesce into one trailing update."""
+        if not all(widget.hasAcceptableInput() for widget in self._boundary_inputs()):
+            # Empty or intermediate input ("-", "1e") - nothing to compute, just clear
+            self._preview_debounce_timer.stop()
+            self._clear_preview()
+            return
+        
+        idle_s = time.monotonic() - self._last_preview_time
+        if idle_s * 1000 > self.PREVIEW_COALESCE_MS and not self._preview_debounce_timer.isActive():
+            # Leading edge: first change after a quiet period gets instant feedback
+            self._run_preview()
+        else:
+            # start() restarts a running timer - this debounces rapid changes (e.g., typing EPSG codes)
+            self._preview_debounce_timer.start()
+    
+    def _clear_preview_if_unacceptable(self):
+        """Clear the preview while any boundary holds empty or intermediate input."""
+        if not all(widget.hasAcceptableInput() for widget in self._boundary_inputs()):
+            self._preview_debounce_timer.stop()
+            self._clear_preview()
+    
+    def _run_preview(self):
+        """Refresh the preview and stamp the time for leading-edge throttling."""
+        self._last_preview_time = time.monotonic()
+        self._do_update_preview()
     
     def _do_update_preview(self):
         """Actually update the preview fields based on current inputs (called after debounce delay)."""
+        # Redundant signals (e.g. focus changes, re-applied text) leave the inputs unchanged
+        key = self._input_key()
+        if key == self._last_preview_key:
+            return
+        self._last_preview_key = key
+        
         boundaries = self._parse_boundaries()
         
         if not boundaries:
-            # Clear preview
-            self.preview_centroid_x.clear()
-            self.preview_centroid_y.clear()
-            self.preview_width.clear()
-            self.preview_height.clear()
-            self.preview_area.clear()
-            self.preview_perimeter.clear()
+            self._clear_preview()
             return
         
         try:
@@ -592,29 +755,33 @@ class QuadBBoxCreatorTool(BaseTool):
                 self.preview_area.setText("East must be > West")
                 return
             
-            # Convert to UTM for calculations
-            utm_corners, epsg_code = self._boundaries_to_utm(north, south, east, west)
-            
-            if not epsg_code or not utm_corners:
-                return
-            
-            # Create polygon
-            polygon = Polygon(utm_corners)
-            
-            if not polygon.is_valid:
-                self.preview_area.setText("Invalid polygon!")
-                return
-            
-            # Get bounds
-            minx, miny, maxx, maxy = polygon.bounds
-            
-            # Calculate centroid, dimensions, area and perimeter
+            if self.utm_radio.isChecked():
+                # UTM input is already a metric axis-aligned rectangle; no projection needed
+                if not self.utm_epsg_input.text().strip():
+                    return
+                minx, miny, maxx, maxy = west, south, east, north
+                width = east - west
+                height = north - south
+                area = width * height
+                perimeter = 2 * (width + height)
+            else:
+                # Convert to UTM for calculations
+                _, utm_corners, epsg_code = self._utm_geometry()
+                
+                if not epsg_code:
+                    return
+                
+                # A lon/lat box projects to a convex quad that is always valid, so the
+                # metrics come straight from the corners without building a Polygon
+                minx, miny = utm_corners.min(axis=0)
+                maxx, maxy = utm_corners.max(axis=0)
+                width = maxx - minx
+                height = maxy - miny
+                area, perimeter = self._ring_area_perimeter(utm_corners)
+            
+            # Calculate centroid
             centroid_x = (minx + maxx) / 2
             centroid_y = (miny + maxy) / 2
-            width = maxx - minx
-            height = maxy - miny
-            area = polygon.area
-            perimeter = polygon.length
             
             # Update preview fields
             self.preview_centroid_x.setText(f"{centroid_x:.2f}")
@@ -627,110 +794,125 @@ class QuadBBoxCreatorTool(BaseTool):
         except Exception as e:
             # Clear preview on error and log for debugging
             logging.debug(f"Preview update failed: {e}")
+            self._last_preview_key = None
             # Set preview to unavailable state on calculation failure
             self.preview_area.setText("--")
             self.preview_perimeter.setText("--")
     
+    def _clear_preview(self):
+        """Clear all preview fields."""
+        self.preview_centroid_x.clear()
+        self.preview_centroid_y.clear()
+        self.preview_width.clear()
+        self.preview_height.clear()
+        self.preview_area.clear()
+        self.preview_perimeter.clear()
+        self._last_preview_key = None
+    
+    def _show_message(self, icon: QMessageBox.Icon, title: str, text: str) -> None:
+        """Show a modal message, reusing one QMessageBox instead of building one per call."""
+        if self._message_box is None:
+            self._message_box = QMessageBox(self)
+            self._message_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        self._message_box.setIcon(icon)
+        self._message_box.setWindowTitle(title)
+        self._message_box.setText(text)
+        self._message_box.exec()
+    
     def validate_inputs(self) -> bool:
         """Validate all inputs before creating the bounding box."""
         # Check if output path is provided
         if not self.output_path.text().strip():
-            QMessageBox.warning(self, "Validation Error", "Please specify an output path.")
+            self._show_message(QMessageBox.Icon.Warning, "Validation Error", "Please specify an output path.")
             return False
         
         # Check if at least one format is selected
-        if not any([
-            self.format_kml.isChecked(),
-            self.format_shp.isChecked(),
-            self.format_geojson.isChecked(),
-            self.format_txt.isChecked(),
-            self.format_kmz.isChecked(),
-            self.format_gpkg.isChecked(),
-            self.format_gml.isChecked(),
-            self.format_tab.isChecked()
-        ]):
-            QMessageBox.warning(self, "Validation Error", "Please select at least one export format.")
+        if not any(checkbox.isChecked() for checkbox in self._format_checkboxes):
+            self._show_message(QMessageBox.Icon.Warning, "Validation Error", "Please select at least one export format.")
             return False
         
         # Check if all boundaries are provided
         boundaries = self._parse_boundaries()
         if not boundaries:
-            QMessageBox.warning(self, "Validation Error", "Please provide all 4 boundaries (North, South, East, West) with valid numeric values.")
+            self._show_message(QMessageBox.Icon.Warning, "Validation Error", "Please provide all 4 boundaries (North, South, East, West) with valid numeric values.")
             return False
         
         north, south, east, west = boundaries
         
         # Validate boundary relationships
         if north <= south:
-            QMessageBox.warning(self, "Validation Error", "North boundary must be greater than South boundary.")
+            self._show_message(QMessageBox.Icon.Warning, "Validation Error", "North boundary must be greater than South boundary.")
             return False
         
         if east <= west:
-            QMessageBox.warning(self, "Validation Error", "East boundary must be greater than West boundary.")
+            self._show_message(QMessageBox.Icon.Warning, "Validation Error", "East boundary must be greater than West boundary.")
             return False
         
+        # Cheap range check before any PROJ/GEOS work in Lon/Lat mode
+        if self.lonlat_radio.isChecked() and not (
+            -90 <= south and north <= 90 and -180 <= west and east <= 180
+        ):
+            self._show_message(
+                QMessageBox.Icon.Warning, "Validation Error",
+                "Lon/Lat boundaries must be within -180 to 180 (East/West) and -90 to 90 (North/South)."
+            )
+            return False
+
         # Check UTM EPSG if in UTM mode
         if self.utm_radio.isChecked():
             epsg_text = self.utm_epsg_input.text().strip()
             if not epsg_text:
-                QMessageBox.warning(self, "Validation Error", "Please provide a UTM zone EPSG code.")
+                self._show_message(QMessageBox.Icon.Warning, "Validation Error", "Please provide a UTM zone EPSG code.")
                 return False
             
             try:
                 epsg_int = int(epsg_text)
                 is_valid, error_msg = validate_utm_epsg(epsg_int)
                 if not is_valid:
-                    QMessageBox.warning(self, "Validation Error", error_msg)
+                    self._show_message(QMessageBox.Icon.Warning, "Validation Error", error_msg)
                     return False
             except ValueError:
-                QMessageBox.warning(self, "Validation Error", "Invalid UTM EPSG code.")
+                self._show_message(QMessageBox.Icon.Warning, "Validation Error", "Invalid UTM EPSG code.")
                 return False
         
-        # Validate polygon
+        # Validate polygon (memoized, so this is free when the preview already ran)
         try:
-            utm_corners, epsg_code = self._boundaries_to_utm(north, south, east, west)
-            if not epsg_code or not utm_corners:
-                QMessageBox.warning(self, "Validation Error", "Failed to determine coordinate system.")
+            _, utm_corners, epsg_code = self._utm_geometry()
+            if not epsg_code:
+                self._show_message(QMessageBox.Icon.Warning, "Validation Error", "Failed to determine coordinate system.")
                 return False
             
-            polygon = Polygon(utm_corners)
-            
-            if not polygon.is_valid:
-                QMessageBox.warning(
-                    self, 
+            if not self._utm_polygon_is_valid():
+                self._show_message(
+                    QMessageBox.Icon.Warning, 
                     "Invalid Polygon", 
                     "The boundaries do not form a valid polygon."
                 )
                 return False
             
         except Exception as e:
-            QMessageBox.warning(self, "Validation Error", f"Error validating bounding box: {str(e)}")
+            self._show_message(QMessageBox.Icon.Warning, "Validation Error", f"Error validating bounding box: {str(e)}")
             return False
         
         return True
     
     def _create_bbox(self):
         """Create the bounding box and export to selected formats."""
-        # Configure GDAL
-        gdal.UseExceptions()
-        
         if not self.validate_inputs():
             return
         
         try:
-            # Parse boundaries
-            boundaries = self._parse_boundaries()
-            if not boundaries:
-                QMessageBox.warning(self, "Validation Error", "Please enter valid boundary values.")
+            # Reuse the geometry already built during validation
+            geometry = self._utm_geometry()
+            if not geometry:
+                self._show_message(QMessageBox.Icon.Warning, "Validation Error", "Please enter valid boundary values.")
                 return
-            north, south, east, west = boundaries
-            utm_corners, utm_epsg = self._boundaries_to_utm(north, south, east, west)
-            if not utm_corners or not utm_epsg:
-                QMessageBox.warning(self, "Validation Error", "Failed to convert coordinates to UTM. Please check your EPSG code.")
+            (north, south, east, west), utm_corners, utm_epsg = geometry
+            if not utm_epsg:
+                self._show_message(QMessageBox.Icon.Warning, "Validation Error", "Failed to convert coordinates to UTM. Please check your EPSG code.")
                 return
             
-            # Create polygon
-            polygon = Polygon(utm_corners)
+            polygon = self._utm_polygon()
             
             # Get bbox name from input
             bbox_name = self.bbox_name_input.text().strip() or "BBox"
@@ -738,8 +920,10 @@ class QuadBBoxCreatorTool(BaseTool):
             # Create GeoDataFrame
             gdf = gpd.GeoDataFrame(
                 {"geometry": [polygon], "name": [bbox_name]},
-                crs=utm_epsg
+                crs=get_crs(utm_epsg)
             )
+            # Reproject once; shared by the exporters and the text report
+            gdf_wgs84 = to_wgs84(gdf)
             
             # Get output path
             output_prefix = Path(self.output_path.text().strip())
@@ -751,25 +935,21 @@ class QuadBBoxCreatorTool(BaseTool):
             # Prepare output message
             results = []
             
-            # Build format dictionary for export utility
-            export_formats = {
-                'geojson': self.format_geojson.isChecked(),
-                'shp': self.format_shp.isChecked(),
-                'gpkg': self.format_gpkg.isChecked(),
-                'gml': self.format_gml.isChecked(),
-                'tab': self.format_tab.isChecked(),
-                'kml': self.format_kml.isChecked(),
-                'kmz': self.format_kmz.isChecked()
-            }
+            # Pass only the enabled format names to the export utility
+            export_formats = tuple(
+                name for name, checkbox in self._export_format_checkboxes if checkbox.isChecked()
+            )
             
             # Export to GIS formats using utility
             try:
                 exported_files = export_geodataframe_multi(
                     gdf, output_prefix, export_formats,
                     layer_name=bbox_name,
-                    keep_utm=self.keep_utm.isChecked()
+                    keep_utm=self.keep_utm.isChecked(),
+                    gdf_wgs84=gdf_wgs84
                 )
-                results = [f"{Path(f).suffix.upper()[1:]}: {f}" for f in exported_files]
+                # Every exported path ends in its format suffix; label from that without a Path
+                results = [f"{f.rpartition('.')[2].upper()}: {f}" for f in exported_files]
             except Exception as e:
                 raise Exception(f"Export failed: {str(e)}") from e
             
@@ -783,18 +963,17 @@ class QuadBBoxCreatorTool(BaseTool):
                 # Generate formatted text content
                 txt_content = self._format_bbox_text_report(
                     bbox_name, north, south, east, west, 
-                    utm_epsg, polygon, gdf, input_mode
+                    utm_epsg, polygon, gdf_wgs84, input_mode
                 )
                 
-                # Write to file
-                with open(txt_path, 'w', encoding='utf-8') as f:
-                    f.write(txt_content)
+                # Write to file in a single call
+                txt_path.write_text(txt_content, encoding='utf-8')
                 
                 results.append(f"Text: {txt_path}")
             
             # Show success message
-            QMessageBox.information(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Information, 
                 "Success",
                 f"Bounding box created successfully!\n\n{len(results)} file(s) exported."
             )
@@ -802,8 +981,8 @@ class QuadBBoxCreatorTool(BaseTool):
             self._update_status(f"Bounding box created: {len(results)} format(s) exported")
         
         except Exception as e:
-            QMessageBox.critical(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Critical, 
                 "Error",
                 f"Failed to create bounding box:\n{str(e)}"
             )
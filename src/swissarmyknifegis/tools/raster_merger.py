@@ -1,11 +1,14 @@
 """Raster Merger Tool - Merge multiple raster files into a single output."""
 
 import os
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import rasterio
+import shapely
 from osgeo import gdal, gdalconst
+from shapely.strtree import STRtree
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QCheckBox,
@@ -39,9 +42,32 @@ gdal.UseExceptions()
 class RasterMergerTool(BaseTool):
     """Tool for merging multiple raster files into a single output raster."""
 
+    # GDAL config applied only around the merge's BuildVRT/Translate calls;
+    # explicit user/environment settings win.
+    # VRT_NUM_THREADS lets GDAL read the VRT's sources for each output block on
+    # several threads instead of one after another, GDAL_NUM_THREADS spreads
+    # decompression of compressed input tiles over all cores, and the larger
+    # block cache keeps source tiles shared by neighbouring output blocks.
+    _GDAL_CONFIG_DEFAULTS = (
+        ('VRT_NUM_THREADS', 'ALL_CPUS'),
+        ('GDAL_NUM_THREADS', 'ALL_CPUS'),
+        ('GDAL_CACHEMAX', '512'),
+    )
+
+    # Per-file numeric fields used by analysis, mirrored from loaded_files as one
+    # structured array so extents and resolution stats are column reductions
+    _FILE_ARRAY_DTYPE = np.dtype([('bounds', np.float64, (4,)), ('res', np.float64)])
+
+    # Upper bound on concurrent header reads when adding files
+    _MAX_INFO_WORKERS = 8
+
+    # Above this many files the pairwise overlap matrix gets large; switch to an STRtree
+    _OVERLAP_BROADCAST_MAX_FILES = 2048
+
     def __init__(self):
         """Initialize the raster merger tool."""
         self.loaded_files: List[Dict[str, Any]] = []
+        self._files_arr = np.zeros(0, dtype=self._FILE_ARRAY_DTYPE)
         self.analysis_results: Optional[Dict[str, Any]] = None
         self.output_directory = ""
         super().__init__()
@@ -62,6 +88,14 @@ class RasterMergerTool(BaseTool):
         }
         return dtype_map.get(numpy_dtype, gdalconst.GDT_Float32)
     
+    @classmethod
+    def _merge_config_options(cls) -> Dict[str, str]:
+        """Merge-scoped GDAL config, skipping keys the user already set."""
+        return {
+            key: value for key, value in cls._GDAL_CONFIG_DEFAULTS
+            if gdal.GetConfigOption(key) is None
+        }
+    
     def _get_gdal_merge_algorithm(self, merge_method: str) -> Optional[str]:
         """Get GDAL VRT pixel function for merge method, or None if not supported."""
         # GDAL VRT pixel functions for different merge methods
@@ -75,6 +109,45 @@ class RasterMergerTool(BaseTool):
         }
         return algorithm_map.get(merge_method)
 
+    @staticmethod
+    def _available_compressions() -> List[str]:
+        """Compression choices offered for the output, fastest codec first.
+
+        ZSTD is only listed when this GDAL build's GeoTIFF driver supports it.
+        """
+        creation_options = gdal.GetDriverByName('GTiff').GetMetadataItem('DMD_CREATIONOPTIONLIST') or ''
+        compressions = ["lzw", "deflate", "none"]
+        if 'ZSTD' in creation_options:
+            compressions.insert(0, "zstd")
+        return compressions
+
+    @staticmethod
+    def _compression_creation_options(output_format: str, output_dtype: str, compression: str) -> List[str]:
+        """Compression creation options for the merged output.
+
+        The predictor is matched to the output type: floating-point prediction
+        for floats, horizontal differencing for integers. ZSTD runs at level 1,
+        which keeps most of its ratio at a fraction of the default level's cost.
+        """
+        codec = compression.upper()
+        if codec == 'NONE':
+            return []
+
+        options = [f'COMPRESS={codec}']
+        if output_format not in ('GTiff', 'COG') or codec not in ('LZW', 'DEFLATE', 'ZSTD'):
+            return options
+
+        if output_format == 'COG':
+            # COG picks FLOATING_POINT or STANDARD from the data type itself
+            options.append('PREDICTOR=YES')
+            if codec == 'ZSTD':
+                options.append('LEVEL=1')
+        else:
+            options.append('PREDICTOR=3' if np.dtype(output_dtype).kind == 'f' else 'PREDICTOR=2')
+            if codec == 'ZSTD':
+                options.append('ZSTD_LEVEL=1')
+        return options
+
     def setup_ui(self):
         """Set up the user interface."""
         main_layout = QVBoxLayout(self)
@@ -97,16 +170,16 @@ class RasterMergerTool(BaseTool):
 
         # File management buttons
         button_layout = QHBoxLayout()
-        add_files_btn = QPushButton("Add Files...")
-        add_files_btn.clicked.connect(self._add_files)
-        remove_files_btn = QPushButton("Remove Selected")
-        remove_files_btn.clicked.connect(self._remove_selected_files)
-        clear_files_btn = QPushButton("Clear All")
-        clear_files_btn.clicked.connect(self._clear_all_files)
-
-        button_layout.addWidget(add_files_btn)
-        button_layout.addWidget(remove_files_btn)
-        button_layout.addWidget(clear_files_btn)
+        self.add_files_btn = QPushButton("Add Files...")
+        self.add_files_btn.clicked.connect(self._add_files)
+        self.remove_files_btn = QPushButton("Remove Selected")
+        self.remove_files_btn.clicked.connect(self._remove_selected_files)
+        self.clear_files_btn = QPushButton("Clear All")
+        self.clear_files_btn.clicked.connect(self._clear_all_files)
+
+        button_layout.addWidget(self.add_files_btn)
+        button_layout.addWidget(self.remove_files_btn)
+        button_layout.addWidget(self.clear_files_btn)
         button_layout.addSpacing(20)
         
         # Quick copy buttons
@@ -226,8 +299,8 @@ class RasterMergerTool(BaseTool):
 
         # Compression
         self.compression_combo = QComboBox()
-        self.compression_combo.addItems(["lzw", "deflate", "none"])
-        self.compression_combo.setCurrentIndex(0)
+        self.compression_combo.addItems(self._available_compressions())
+        self.compression_combo.setCurrentIndex(0)  # ZSTD when this GDAL build has it
         params_layout.addRow("Compression:", self.compression_combo)
 
         params_group.setLayout(params_layout)
@@ -308,84 +381,124 @@ class RasterMergerTool(BaseTool):
             # Save the directory of the first selected file
             self._save_last_path("paths/input/raster_files", file_paths[0])
 
-        for file_path in file_paths:
-            # Check if already loaded
-            if any(f["path"] == file_path for f in self.loaded_files):
-                continue
+        # Skip files that are already loaded (or selected twice)
+        loaded_paths = {f["path"] for f in self.loaded_files}
+        new_paths = [p for p in dict.fromkeys(file_paths) if p not in loaded_paths]
 
-            # Get file info
-            file_info = self._get_file_info(file_path)
-            if file_info:
-                self.loaded_files.append(file_info)
+        if new_paths:
+            # processEvents() keeps the window painting while headers are read;
+            # lock the file list so no click can re-enter and change it meanwhile
+            self._set_file_buttons_enabled(False)
+            try:
+                # Header reads are I/O bound and rasterio releases the GIL while
+                # opening, so read them concurrently, one dataset per worker
+                with ThreadPoolExecutor(max_workers=min(self._MAX_INFO_WORKERS, len(new_paths))) as executor:
+                    futures = [executor.submit(self._get_file_info, p) for p in new_paths]
+                    # Collect in selection order; merge precedence follows the file order
+                    for file_path, future in zip(new_paths, futures):
+                        QCoreApplication.processEvents()
+                        try:
+                            self.loaded_files.append(future.result())
+                        except Exception as e:
+                            QMessageBox.warning(
+                                self,
+                                "Error Reading File",
+                                f"Could not read {os.path.basename(file_path)}:\n{str(e)}",
+                            )
+            finally:
+                self._set_file_buttons_enabled(True)
 
+        self._rebuild_file_array()
         self._update_table()
         self.analysis_results = None
         self._update_button_states()
 
-    def _get_file_info(self, file_path: str) -> Optional[Dict[str, Any]]:
-        """Extract information from a raster file."""
-        try:
-            with rasterio.open(file_path) as src:
-                crs_str = str(src.crs) if src.crs else "No CRS"
-                
-                # Calculate pixel resolution (in the units of the CRS)
-                pixel_width = abs(src.transform.a)
-                pixel_height = abs(src.transform.e)
-                avg_resolution = (pixel_width + pixel_height) / 2
+    def _set_file_buttons_enabled(self, enabled: bool):
+        """Enable or disable every control that changes the file list or uses it."""
+        for button in (self.add_files_btn, self.remove_files_btn, self.clear_files_btn):
+            button.setEnabled(enabled)
+        if enabled:
+            self._update_button_states()
+        else:
+            self.analyze_button.setEnabled(False)
+            self.merge_button.setEnabled(False)
 
-                # Get nodata value from first band if available
-                nodata_value = None
-                if src.count > 0:
-                    nodata_value = src.nodata
-                nodata_str = str(nodata_value) if nodata_value is not None else "None"
-
-                return {
-                    "filename": os.path.basename(file_path),
-                    "path": file_path,
-                    "crs": crs_str,
-                    "crs_obj": src.crs,
-                    "width": src.width,
-                    "height": src.height,
-                    "bounds": src.bounds,
-                    "transform": src.transform,
-                    "resolution": avg_resolution,
-                    "pixel_width": pixel_width,
-                    "pixel_height": pixel_height,
-                    "count": src.count,
-                    "dtype": src.dtypes[0] if src.dtypes else "unknown",
-                    "nodata": nodata_value,
-                    "nodata_str": nodata_str,
-                }
-        except Exception as e:
-            QMessageBox.warning(
-                self,
-                "Error Reading File",
-                f"Could not read {os.path.basename(file_path)}:\n{str(e)}",
-            )
-            return None
+    @staticmethod
+    def _get_file_info(file_path: str) -> Dict[str, Any]:
+        """Extract information from a raster file.
+
+        Runs on worker threads, so it raises instead of showing a dialog.
+        """
+        with rasterio.open(file_path) as src:
+            crs_str = str(src.crs) if src.crs else "No CRS"
+            
+            # Calculate pixel resolution (in the units of the CRS)
+            pixel_width = abs(src.transform.a)
+            pixel_height = abs(src.transform.e)
+            avg_resolution = (pixel_width + pixel_height) / 2
+
+            # Get nodata value from first band if available
+            nodata_value = None
+            if src.count > 0:
+                nodata_value = src.nodata
+            nodata_str = str(nodata_value) if nodata_value is not None else "None"
+
+            return {
+                "filename": os.path.basename(file_path),
+                "path": file_path,
+                "crs": crs_str,
+                "crs_obj": src.crs,
+                "width": src.width,
+                "height": src.height,
+                "bounds": src.bounds,
+                "transform": src.transform,
+                "resolution": avg_resolution,
+                "pixel_width": pixel_width,
+                "pixel_height": pixel_height,
+                "count": src.count,
+                "dtype": src.dtypes[0] if src.dtypes else "unknown",
+                "nodata": nodata_value,
+                "nodata_str": nodata_str,
+            }
+
+    def _rebuild_file_array(self):
+        """Rebuild the structured array mirroring loaded_files' numeric fields."""
+        self._files_arr = np.array(
+            [(tuple(f["bounds"]), f["resolution"]) for f in self.loaded_files],
+            dtype=self._FILE_ARRAY_DTYPE,
+        )
 
     def _update_table(self):
         """Update the file table."""
-        self.files_table.setRowCount(len(self.loaded_files))
-
-        for row, file_info in enumerate(self.loaded_files):
-            items = [
-                file_info["filename"],
-                file_info["crs"],
-                str(file_info["width"]),
-                str(file_info["height"]),
-                f"{file_info['resolution']:.2f}",
-                file_info["dtype"],
-                file_info["nodata_str"],
-                file_info["path"],
-            ]
-
-            for col, item_text in enumerate(items):
-                item = QTableWidgetItem(item_text)
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.files_table.setItem(row, col, item)
-
-        self.files_table.resizeColumnsToContents()
+        table = self.files_table
+        # Fill every cell with repaints and sorting suspended so Qt lays the
+        # table out once; the ResizeToContents header then sizes the columns
+        was_sorting = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        try:
+            table.setRowCount(len(self.loaded_files))
+            read_only_flags = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+            for row, file_info in enumerate(self.loaded_files):
+                items = [
+                    file_info["filename"],
+                    file_info["crs"],
+                    str(file_info["width"]),
+                    str(file_info["height"]),
+                    f"{file_info['resolution']:.2f}",
+                    file_info["dtype"],
+                    file_info["nodata_str"],
+                    file_info["path"],
+                ]
+
+                for col, item_text in enumerate(items):
+                    item = QTableWidgetItem(item_text)
+                    item.setFlags(read_only_flags)
+                    table.setItem(row, col, item)
+        finally:
+            table.setSortingEnabled(was_sorting)
+            table.setUpdatesEnabled(True)
 
     def _remove_selected_files(self):
         """Remove selected files from the list."""
@@ -398,12 +511,15 @@ class RasterMergerTool(BaseTool):
             if 0 <= row < len(self.loaded_files):
                 del self.loaded_files[row]
 
+        self._rebuild_file_array()
         self._update_table()
         self.analysis_results = None
         self._update_button_states()
+
     def _clear_all_files(self):
         """Clear all loaded files."""
         self.loaded_files.clear()
+        self._rebuild_file_array()
         self._update_table()
         self.analysis_results = None
         self._update_button_states()
@@ -541,8 +657,10 @@ class RasterMergerTool(BaseTool):
                 progress_dialog.setLabelText("Building VRT...")
                 QCoreApplication.processEvents()
             
+            config_options = self._merge_config_options()
             try:
-                vrt_dataset = gdal.BuildVRT('', input_files, options=vrt_options)
+                with gdal.config_options(config_options):
+                    vrt_dataset = gdal.BuildVRT('', input_files, options=vrt_options)
                 if vrt_dataset is None:
                     raise RuntimeError("GDAL BuildVRT returned None - failed to create VRT")
                 # Validate that VRT has expected properties
@@ -559,20 +677,26 @@ class RasterMergerTool(BaseTool):
                 self.results_display.append("Note: Complex merge methods may use default behavior")
             
             # Prepare creation options
-            creation_options = []
+            creation_options = self._compression_creation_options(output_format, output_dtype, compression)
             
-            if compression.upper() != 'NONE':
-                creation_options.append(f'COMPRESS={compression.upper()}')
-            
-            # Add format-specific options
+            # Add format-specific options: 512 px tiles, BigTIFF once the output
+            # could pass 4 GiB, and GDAL's thread pool for block compression
             if output_format == 'COG':
                 creation_options.extend([
-                    'TILED=YES',
                     'BLOCKSIZE=512',
                     'OVERVIEWS=IGNORE_EXISTING',
+                    'OVERVIEW_RESAMPLING=' + ('AVERAGE' if np.dtype(output_dtype).kind == 'f' else 'NEAREST'),
+                    'BIGTIFF=IF_SAFER',
+                    'NUM_THREADS=ALL_CPUS',
                 ])
             elif output_format == 'GTiff':
-                creation_options.append('TILED=YES')
+                creation_options.extend([
+                    'TILED=YES',
+                    'BLOCKXSIZE=512',
+                    'BLOCKYSIZE=512',
+                    'BIGTIFF=IF_SAFER',
+                    'NUM_THREADS=ALL_CPUS',
+                ])
             
             # Translate VRT to output format
             self.results_display.append(f"Translating to {output_format} format...")
@@ -592,11 +716,12 @@ class RasterMergerTool(BaseTool):
             
             translate_options = gdal.TranslateOptions(**translate_options_dict)
             
-            output_dataset = gdal.Translate(
-                output_path,
-                vrt_dataset,
-                options=translate_options,
-            )
+            with gdal.config_options(config_options):
+                output_dataset = gdal.Translate(
+                    output_path,
+                    vrt_dataset,
+                    options=translate_options,
+                )
             
             if output_dataset is None:
                 raise Exception("Failed to translate VRT to output format")
@@ -621,6 +746,42 @@ class RasterMergerTool(BaseTool):
             self.results_display.append(f"✗ GDAL merge error: {str(e)}")
             raise
     
+    @classmethod
+    def _find_overlaps(cls, bounds: np.ndarray) -> List[Tuple[int, int, float, float]]:
+        """Find every overlapping pair of file extents.
+
+        Args:
+            bounds: (N, 4) array of (left, bottom, right, top) rows
+
+        Returns:
+            List of (i, j, overlap_percent, overlap_area) with i < j in row-major
+            order, where overlap_percent is relative to file i's area
+        """
+        left, bottom, right, top = bounds.T
+        if len(bounds) <= cls._OVERLAP_BROADCAST_MAX_FILES:
+            # Pairwise intersections of all extents in one broadcast pass
+            width = np.minimum(right[:, None], right[None, :]) - np.maximum(left[:, None], left[None, :])
+            height = np.minimum(top[:, None], top[None, :]) - np.maximum(bottom[:, None], bottom[None, :])
+            i, j = np.nonzero(np.triu((width > 0) & (height > 0), k=1))
+            width, height = width[i, j], height[i, j]
+        else:
+            # Candidate pairs from a spatial index, then the same exact test
+            tree = STRtree(shapely.box(left, bottom, right, top))
+            i, j = tree.query(tree.geometries, predicate='intersects')
+            keep = i < j
+            i, j = i[keep], j[keep]
+            width = np.minimum(right[i], right[j]) - np.maximum(left[i], left[j])
+            height = np.minimum(top[i], top[j]) - np.maximum(bottom[i], bottom[j])
+            keep = (width > 0) & (height > 0)
+            i, j, width, height = i[keep], j[keep], width[keep], height[keep]
+            order = np.lexsort((j, i))
+            i, j, width, height = i[order], j[order], width[order], height[order]
+
+        overlap_area = width * height
+        file_area = (right[i] - left[i]) * (top[i] - bottom[i])
+        overlap_percent = overlap_area / file_area * 100
+        return list(zip(i.tolist(), j.tolist(), overlap_percent.tolist(), overlap_area.tolist()))
+
     def _on_analyze(self):
         """Analyze raster files for compatibility."""
         self.results_display.clear()
@@ -637,56 +798,68 @@ class RasterMergerTool(BaseTool):
             return
 
         try:
+            # Distinct values of each compared property; the per-file scans below
+            # only run to name the offending file once a set shows a mismatch
+            crs_strings = {f["crs"] for f in self.loaded_files}
+            band_counts = {f["count"] for f in self.loaded_files}
+            dtypes = {f["dtype"] for f in self.loaded_files}
+
             # Check CRS compatibility
             self.results_display.append("Checking CRS compatibility...")
             first_crs = self.loaded_files[0]["crs_obj"]
-            for i, file_info in enumerate(self.loaded_files):
-                if file_info["crs_obj"] != first_crs:
-                    self.results_display.append(
-                        f"✗ Error: CRS mismatch detected!\n"
-                        f"  File 1: {self.loaded_files[0]['crs']}\n"
-                        f"  File {i + 1}: {file_info['crs']}\n"
-                        f"  All files must have identical CRS."
-                    )
-                    return
+            if len(crs_strings) > 1:
+                # Differently written CRS may still be equal, so the CRS objects decide
+                for i, file_info in enumerate(self.loaded_files):
+                    if file_info["crs_obj"] != first_crs:
+                        self.results_display.append(
+                            f"✗ Error: CRS mismatch detected!\n"
+                            f"  File 1: {self.loaded_files[0]['crs']}\n"
+                            f"  File {i + 1}: {file_info['crs']}\n"
+                            f"  All files must have identical CRS."
+                        )
+                        return
 
             self.results_display.append(f"✓ All files use CRS: {first_crs}")
 
             # Check band count compatibility
             self.results_display.append("\nChecking band compatibility...")
             first_bands = self.loaded_files[0]["count"]
-            for i, file_info in enumerate(self.loaded_files):
-                if file_info["count"] != first_bands:
-                    self.results_display.append(
-                        f"✗ Error: Band count mismatch!\n"
-                        f"  File 1: {first_bands} bands\n"
-                        f"  File {i + 1}: {file_info['count']} bands"
-                    )
-                    return
+            if len(band_counts) > 1:
+                i, file_info = next(
+                    (i, f) for i, f in enumerate(self.loaded_files) if f["count"] != first_bands
+                )
+                self.results_display.append(
+                    f"✗ Error: Band count mismatch!\n"
+                    f"  File 1: {first_bands} bands\n"
+                    f"  File {i + 1}: {file_info['count']} bands"
+                )
+                return
 
             self.results_display.append(f"✓ All files have {first_bands} bands")
 
             # Check data type compatibility
             self.results_display.append("\nChecking data type compatibility...")
             first_dtype = self.loaded_files[0]["dtype"]
-            for i, file_info in enumerate(self.loaded_files):
-                if file_info["dtype"] != first_dtype:
-                    self.results_display.append(
-                        f"✗ Error: Data type mismatch!\n"
-                        f"  File 1: {first_dtype}\n"
-                        f"  File {i + 1}: {file_info['dtype']}"
-                    )
-                    return
+            if len(dtypes) > 1:
+                i, file_info = next(
+                    (i, f) for i, f in enumerate(self.loaded_files) if f["dtype"] != first_dtype
+                )
+                self.results_display.append(
+                    f"✗ Error: Data type mismatch!\n"
+                    f"  File 1: {first_dtype}\n"
+                    f"  File {i + 1}: {file_info['dtype']}"
+                )
+                return
 
             self.results_display.append(f"✓ All files have data type: {first_dtype}")
 
             # Calculate bounds and overlaps
             self.results_display.append("\nAnalyzing spatial coverage...")
-            bounds_list = [f["bounds"] for f in self.loaded_files]
-            min_left = min(b.left for b in bounds_list)
-            min_bottom = min(b.bottom for b in bounds_list)
-            max_right = max(b.right for b in bounds_list)
-            max_top = max(b.top for b in bounds_list)
+            # (N, 4) array of (left, bottom, right, top); every extent and area below
+            # is a single reduction over its columns
+            bounds_array = self._files_arr["bounds"]
+            min_left, min_bottom = bounds_array[:, :2].min(axis=0).tolist()
+            max_right, max_top = bounds_array[:, 2:].max(axis=0).tolist()
 
             output_bounds = (min_left, min_bottom, max_right, max_top)
             output_width = max_right - min_left
@@ -699,30 +872,13 @@ class RasterMergerTool(BaseTool):
 
             # Check for overlaps and gaps between files
             self.results_display.append("\nAnalyzing file relationships...")
-            total_file_area = sum(
-                (b.right - b.left) * (b.top - b.bottom) for b in bounds_list
+            total_file_area = float(
+                ((bounds_array[:, 2] - bounds_array[:, 0]) * (bounds_array[:, 3] - bounds_array[:, 1])).sum()
             )
             
             # Detect overlaps
-            overlap_detected = False
-            overlap_pairs = []
-            for i in range(len(bounds_list)):
-                for j in range(i + 1, len(bounds_list)):
-                    b1 = bounds_list[i]
-                    b2 = bounds_list[j]
-                    
-                    # Check if rectangles overlap
-                    overlap_left = max(b1.left, b2.left)
-                    overlap_right = min(b1.right, b2.right)
-                    overlap_bottom = max(b1.bottom, b2.bottom)
-                    overlap_top = min(b1.top, b2.top)
-                    
-                    if overlap_left < overlap_right and overlap_bottom < overlap_top:
-                        overlap_area = (overlap_right - overlap_left) * (overlap_top - overlap_bottom)
-                        file1_area = (b1.right - b1.left) * (b1.top - b1.bottom)
-                        overlap_percent = (overlap_area / file1_area) * 100
-                        overlap_detected = True
-                        overlap_pairs.append((i, j, overlap_percent, overlap_area))
+            overlap_pairs = self._find_overlaps(bounds_array)
+            overlap_detected = bool(overlap_pairs)
             
             if overlap_detected:
                 self.results_display.append(f"✓ Overlaps detected: {len(overlap_pairs)} pair(s)")
@@ -753,7 +909,9 @@ class RasterMergerTool(BaseTool):
                 self.results_display.append("✓ Files provide complete coverage with minimal overlap")
             
             # Calculate estimated output dimensions
-            finest_res = min(f["resolution"] for f in self.loaded_files)
+            resolutions = self._files_arr["res"]
+            finest_res = float(resolutions.min())
+            coarsest_res = float(resolutions.max())
             estimated_width = int(output_width / finest_res)
             estimated_height = int(output_height / finest_res)
             self.results_display.append(
@@ -765,9 +923,6 @@ class RasterMergerTool(BaseTool):
 
             # Calculate resolution statistics
             self.results_display.append("\nResolution analysis:")
-            resolutions = [f["resolution"] for f in self.loaded_files]
-            finest_res = min(resolutions)
-            coarsest_res = max(resolutions)
 
             self.results_display.append(
                 f"  Finest resolution: {finest_res:.4f} (smallest pixels)"
@@ -0,0 +1,51 @@
+"""
+Tests for the GIS Cropper tool.
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+gpd = pytest.importorskip("geopandas")
+pytest.importorskip("pyogrio")
+pytest.importorskip("pyarrow")
+pytest.importorskip("osgeo.gdal")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+import shapely
+from pyproj import CRS
+from shapely.geometry import Point, box
+
+from swissarmyknifegis.tools.gis_cropper import GISCropperTool
+
+
+@pytest.fixture(scope="module")
+def cropper():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    tool = GISCropperTool()
+    yield tool
+    tool.deleteLater()
+    app.processEvents()
+
+
+def test_crop_vector_geojson(cropper, tmp_path):
+    """A small GeoJSON is streamed, clipped to the bbox and written back out."""
+    src = tmp_path / "points.geojson"
+    gpd.GeoDataFrame(
+        {"name": ["in_a", "in_b", "out"]},
+        geometry=[Point(0.5, 0.5), Point(1.5, 1.5), Point(5, 5)],
+        crs="EPSG:4326",
+    ).to_file(src, driver="GeoJSON")
+
+    out = tmp_path / "cropped_points.geojson"
+    messages = []
+    cropper._crop_vector(
+        str(src), shapely.to_wkb(box(0, 0, 2, 2)), CRS.from_epsg(4326), out, messages.append
+    )
+
+    result = gpd.read_file(out)
+    assert sorted(result["name"]) == ["in_a", "in_b"]
+    assert result.crs.equals(CRS.from_epsg(4326))
+    assert messages